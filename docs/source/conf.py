@@ -20,7 +20,6 @@ release = "1.0.0"
 # -- General configuration -----------------------------------------------------
 extensions = [
     "sphinx.ext.autodoc",
-    "sphinx.ext.autosummary",
     "sphinx.ext.napoleon",
     "sphinx.ext.intersphinx",
     "sphinx.ext.viewcode",
@@ -46,6 +45,9 @@ html_theme_options = {
     "style_external_links": False,
     "vcs_pageview_mode": "",
     "style_nav_header_background": "#2980B9",
+    "collapse_navigation": True,
+    "navigation_depth": 2,
+    "titles_only": True,
 }
 
 # -- Options for autodoc output -----------------------------------------------
@@ -57,8 +59,6 @@ autodoc_default_options = {
     "show-inheritance": True,
 }
 
-autosummary_generate = True
-
 # Suppress expected warnings that don't affect documentation quality
 suppress_warnings = [
     "autodoc.duplicate_object_description",  # From autodoc generating both explicit and auto docs
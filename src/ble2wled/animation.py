@@ -18,6 +18,8 @@ Example:
         add_trail(leds, pos, color, trail_length=10, fade_factor=0.75)
 """
 
+import functools
+
 
 class BeaconRunner:
     """Manages animation positions for beacons moving along LED strip.
@@ -30,6 +32,8 @@ class BeaconRunner:
         positions (dict): Current position of each beacon.
     """
 
+    __slots__ = ("led_count", "positions")
+
     def __init__(self, led_count: int):
         """Initialize beacon runner.
 
@@ -70,6 +74,20 @@ class BeaconRunner:
         return pos
 
 
+@functools.lru_cache(maxsize=64)
+def _fade_table(fade_factor: float, trail_length: int) -> tuple[float, ...]:
+    """Return the per-segment brightness multipliers for a trail.
+
+    Args:
+        fade_factor (float): Brightness decay per segment.
+        trail_length (int): Number of segments in the trail.
+
+    Returns:
+        tuple: ``fade_factor ** i`` for each segment index ``i``.
+    """
+    return tuple(fade_factor**i for i in range(trail_length))
+
+
 def add_trail(
     leds: list[list[int]],
     position: int,
@@ -107,11 +125,23 @@ def add_trail(
                      trail_length=8, fade_factor=0.75)
             # Now leds[10] has max red, leds[9] has 75% red, etc.
     """
-    r, g, b = color
-    for i in range(trail_length):
-        idx = (position - i) % len(leds)
-        fade = fade_factor**i
+    led_count = len(leds)
+    # Nothing to draw; also keeps an empty strip out of the modulo below
+    if trail_length <= 0 or not led_count:
+        return
 
-        leds[idx][0] = min(255, int(leds[idx][0] + r * fade))
-        leds[idx][1] = min(255, int(leds[idx][1] + g * fade))
-        leds[idx][2] = min(255, int(leds[idx][2] + b * fade))
+    r, g, b = color
+    idx = position % led_count
+    for fade in _fade_table(fade_factor, trail_length):
+        led = leds[idx]
+
+        # Clamp with conditionals; avoids a min() call per channel
+        red = int(led[0] + r * fade)
+        green = int(led[1] + g * fade)
+        blue = int(led[2] + b * fade)
+        led[0] = red if red < 255 else 255
+        led[1] = green if green < 255 else 255
+        led[2] = blue if blue < 255 else 255
+
+        # Step backwards along the strip, wrapping from 0 to the last LED
+        idx = idx - 1 if idx else led_count - 1
@@ -22,6 +22,7 @@ Options:
 
 import argparse
 import logging
+import math
 import signal
 import sys
 import threading
@@ -33,11 +34,16 @@ from .mqtt import EspresenseBeaconListener
 from .simulator import LEDSimulator, MockBeaconGenerator
 from .states import BeaconState
 
+# Maximum refresh rate of the MQTT statistics line in Hz
+STATS_REFRESH_RATE = 4.0
+
 
 class MQTTStatistics:
     """Track MQTT message statistics for real-time display.
 
-    Monitors message count, rate, and per-beacon statistics.
+    Monitors message count, rate, and per-beacon statistics. The message
+    rate is measured against the monotonic clock, so wall-clock adjustments
+    do not skew it; last_message_time stays a wall-clock timestamp.
     """
 
     def __init__(self):
@@ -45,7 +51,7 @@ class MQTTStatistics:
         self.total_messages = 0
         self.messages_by_beacon = {}
         self.last_message_time = None
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.lock = threading.Lock()
 
     def record_message(self, beacon_id: str) -> None:
@@ -67,16 +73,19 @@ class MQTTStatistics:
         Returns:
             dict: Statistics including total messages, rate, and per-beacon counts.
         """
+        # Only copy the counters under the lock; derive the rest outside it
         with self.lock:
-            elapsed = time.time() - self.start_time
-            rate = self.total_messages / elapsed if elapsed > 0 else 0
-            return {
-                "total": self.total_messages,
-                "rate": rate,
-                "elapsed": elapsed,
-                "by_beacon": dict(self.messages_by_beacon),
-                "unique_beacons": len(self.messages_by_beacon),
-            }
+            total = self.total_messages
+            by_beacon = dict(self.messages_by_beacon)
+        elapsed = time.monotonic() - self.start_time
+        rate = total / elapsed if elapsed > 0 else 0
+        return {
+            "total": total,
+            "rate": rate,
+            "elapsed": elapsed,
+            "by_beacon": by_beacon,
+            "unique_beacons": len(by_beacon),
+        }
 
 
 class StatisticsTrackingBeaconState(BeaconState):
@@ -100,6 +109,8 @@ class StatisticsTrackingBeaconState(BeaconState):
         """
         super().__init__(timeout_seconds, fade_out_seconds)
         self.stats = stats
+        # Bound once; update() runs for every received beacon message
+        self._record_message = stats.record_message
 
     def update(self, beacon_id: str, rssi: int) -> None:
         """Update beacon and record statistics.
@@ -109,7 +120,7 @@ class StatisticsTrackingBeaconState(BeaconState):
             rssi (int): Signal strength in dBm.
         """
         super().update(beacon_id, rssi)
-        self.stats.record_message(beacon_id)
+        self._record_message(beacon_id)
 
 
 def handle_interrupt(_signum, _frame):
@@ -206,8 +217,12 @@ def main(
 
     # Initialize statistics tracker for MQTT mode
     mqtt_stats: MQTTStatistics | None = None
+    stats_every_frames = 1
     if use_mqtt:
         mqtt_stats = MQTTStatistics()
+        # Refresh the statistics line less often than frames are rendered
+        if update_interval > 0:
+            stats_every_frames = math.ceil(1 / (STATS_REFRESH_RATE * update_interval))
         beacon_state = StatisticsTrackingBeaconState(
             mqtt_stats, timeout_seconds=3.0, fade_out_seconds=2.0
         )
@@ -260,13 +275,18 @@ def main(
     print("Press Ctrl+C to exit")
     print("=" * 80 + "\n")
 
-    start_time = time.time()
+    start_time = time.monotonic()
+    next_frame_time = start_time
     frame_count = 0
 
+    # Frame buffer reused across frames; LEDSimulator.update copies it.
+    leds = [[0, 0, 0] for _ in range(led_count)]
+    strip_blank = False
+
     try:
         while True:
             # Check if duration exceeded
-            if duration and time.time() - start_time > duration:
+            if duration and time.monotonic() - start_time > duration:
                 logger.info("Duration limit reached. Stopping simulation.")
                 break
 
@@ -284,21 +304,25 @@ def main(
                     for beacon_id, rssi in beacon_data.items():
                         beacon_state.update(beacon_id, rssi)
 
-            # Render LED strip
-            leds = [[0, 0, 0] for _ in range(led_count)]
+            # Render LED strip, skipping idle frames once the strip is blank
+            beacons = beacon_state.snapshot()
+            if beacons or not strip_blank:
+                for led in leds:
+                    led[0] = led[1] = led[2] = 0
 
-            for beacon_id, (rssi, life) in beacon_state.snapshot().items():
-                pos = beacon_runner.next_position(beacon_id)
-                color = ble_beacon_to_rgb(beacon_id, rssi, life)
-                add_trail(leds, pos, color, trail_length, fade_factor)
+                for beacon_id, (rssi, life) in beacons.items():
+                    pos = beacon_runner.next_position(beacon_id)
+                    color = ble_beacon_to_rgb(beacon_id, rssi, life)
+                    add_trail(leds, pos, color, trail_length, fade_factor)
 
-            # Update simulator display
-            simulator.update(leds)
+                # Update simulator display
+                simulator.update(leds)
+                strip_blank = not beacons
 
-            # Display MQTT statistics if enabled
-            if use_mqtt and mqtt_stats:
+            # Display MQTT statistics if enabled, at most STATS_REFRESH_RATE Hz
+            if use_mqtt and mqtt_stats and (frame_count - 1) % stats_every_frames == 0:
                 stats = mqtt_stats.get_stats()
-                active_beacons = len(beacon_state.snapshot())
+                active_beacons = len(beacons)
                 elapsed = stats["elapsed"]
                 fps = frame_count / elapsed if elapsed > 0 else 0
 
@@ -313,16 +337,25 @@ def main(
                     flush=True,
                 )
 
-            # Sleep for update interval
-            time.sleep(update_interval)
+            # Sleep until the next frame is due so render time does not add
+            # to the frame period; if we fell behind, restart the schedule
+            next_frame_time += update_interval
+            now = time.monotonic()
+            delay = next_frame_time - now
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_frame_time = now
 
     except KeyboardInterrupt:
         print("\n\nSimulation interrupted by user.")
     finally:
+        if mqtt_listener:
+            mqtt_listener.stop()
         logger.info(
             "Simulation complete. Rendered %d frames in %.2fs",
             frame_count,
-            time.time() - start_time,
+            time.monotonic() - start_time,
         )
 
 
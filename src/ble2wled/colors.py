@@ -22,7 +22,7 @@ Example:
         print(f\"Beacon at {distance:.2f}m: RGB{color}\")
 """
 
-import colorsys
+import functools
 import hashlib
 
 
@@ -108,10 +108,28 @@ def gradient_color(
     d = max(near, min(far, distance))
     t = (d - near) / (far - near)
 
+    # lerp(0, 1, x) and lerp(1, 0, x) written out to avoid the call overhead
     if t < 0.5:
-        return lerp(0, 1, t / 0.5), 1.0, 0.0
+        return t / 0.5, 1.0, 0.0
     else:
-        return 1.0, lerp(1, 0, (t - 0.5) / 0.5), 0.0
+        return 1.0, 1.0 - (t - 0.5) / 0.5, 0.0
+
+
+@functools.lru_cache(maxsize=1024)
+def _beacon_hue_offset(beacon_id: str) -> float:
+    """Return the stable hue offset (0.0 to 0.08) for a beacon.
+
+    The offset only depends on the beacon ID, so it is hashed once and
+    cached instead of being recomputed every frame.
+
+    Args:
+        beacon_id (str): Unique beacon identifier.
+
+    Returns:
+        float: Hue offset derived from the SHA-256 hash of the ID.
+    """
+    beacon_hash = hashlib.sha256(beacon_id.encode()).digest()
+    return (int.from_bytes(beacon_hash[:3], "big") / 0xFFFFFF) * 0.08
 
 
 def ble_beacon_to_rgb(beacon_id: str, rssi: int, life: float) -> tuple[int, int, int]:
@@ -147,13 +165,31 @@ def ble_beacon_to_rgb(beacon_id: str, rssi: int, life: float) -> tuple[int, int,
     distance = estimate_distance_from_rssi(rssi)
     r, g, b = gradient_color(distance)
 
-    # Create unique hue offset for each beacon based on its hash
-    beacon_hash = hashlib.sha256(beacon_id.encode()).hexdigest()
-    hue_offset = (int(beacon_hash[:6], 16) / 0xFFFFFF) * 0.08
+    # Unique hue offset for each beacon based on its hash
+    hue_offset = _beacon_hue_offset(beacon_id)
+
+    # The gradient always lies on the green -> yellow -> red arc (red or
+    # green at 1.0, blue at 0.0), so hue runs from 1/3 down to 0 while
+    # saturation and value stay 1.0. This is colorsys.rgb_to_hsv /
+    # hsv_to_rgb specialised to that arc. Terms such as (1.0 - (1.0 - g))
+    # are deliberate: they repeat colorsys's float operations so the result
+    # is bit-identical, which plain g would not always be.
+    if r == 1.0:
+        h = (1.0 - (1.0 - g)) / 6.0
+    else:
+        h = (2.0 + (1.0 - r) - 1.0) / 6.0
 
-    # Apply hue shift and life-based brightness
-    h, s, v = colorsys.rgb_to_hsv(r, g, b)
+    # Apply hue shift and life-based brightness; p is colorsys's v * (1 - s)
     h = (h + hue_offset) % 1.0
-    r, g, b = colorsys.hsv_to_rgb(h, s, v * life)
+    v = life
+    sector = int(h * 6.0)
+    f = (h * 6.0) - sector
+    p = 0.0
+    if sector == 0:
+        r, g, b = v, v * (1.0 - (1.0 - f)), p
+    elif sector == 1:
+        r, g, b = v * (1.0 - f), v, p
+    else:
+        r, g, b = p, v, v * (1.0 - (1.0 - f))
 
     return int(r * 255), int(g * 255), int(b * 255)
@@ -3,7 +3,8 @@
 This module provides centralized configuration management for BLE2WLED using
 environment variables and .env files. Configuration is loaded from .env on
 initialization and provides property-based access with type conversion,
-validation, and sensible defaults.
+validation, and sensible defaults. Each value is read and converted once per
+Config instance and cached afterwards.
 
 Configuration Hierarchy:
     1. .env file (if it exists)
@@ -30,16 +31,51 @@ Example:
 
 import logging
 import os
+from functools import cached_property
 from typing import TYPE_CHECKING
 
-from dotenv import load_dotenv
-
 if TYPE_CHECKING:
     pass
 
 logger = logging.getLogger(__name__)
 
 
+def _load_env_file(path: str) -> None:
+    """Load ``KEY=VALUE`` lines from a .env file into ``os.environ``.
+
+    Supports blank lines, ``#`` comments, an optional ``export`` prefix,
+    single- or double-quoted values and trailing `` #`` comments. A ``#``
+    inside quotes is part of the value. Variables already set in the
+    environment are not overridden.
+
+    Args:
+        path (str): Path to the .env file.
+    """
+    with open(path, encoding="utf-8") as env_file:
+        for line in env_file:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("export "):
+                line = line[len("export ") :].lstrip()
+
+            key, sep, value = line.partition("=")
+            key = key.strip()
+            if not sep or not key:
+                continue
+
+            value = value.strip()
+            # A quoted value ends at its closing quote; anything after it,
+            # such as a trailing comment, is dropped
+            closing = value.find(value[0], 1) if value[:1] in ("'", '"') else -1
+            if closing != -1:
+                value = value[1:closing]
+            else:
+                value = value.split(" #", 1)[0].rstrip()
+
+            os.environ.setdefault(key, value)
+
+
 class Config:
     """Centralized configuration management for BLE2WLED.
 
@@ -83,13 +119,13 @@ class Config:
             env_file = ".env"
 
         if os.path.exists(env_file):
-            load_dotenv(env_file, verbose=True)
+            _load_env_file(env_file)
             logger.info("Loaded configuration from %s", env_file)
         else:
             logger.warning("Configuration file %s not found", env_file)
 
     # WLED Configuration
-    @property
+    @cached_property
     def wled_host(self) -> str:
         """WLED device hostname or IP address.
 
@@ -105,7 +141,7 @@ class Config:
         """
         return os.getenv("WLED_HOST", "wled.local")
 
-    @property
+    @cached_property
     def led_count(self) -> int:
         """Number of LEDs in the strip.
 
@@ -127,7 +163,7 @@ class Config:
             raise ValueError(f"LED_COUNT must be positive, got {count}")
         return count
 
-    @property
+    @cached_property
     def output_mode(self) -> str:
         """LED output mode: 'udp' or 'http'.
 
@@ -153,7 +189,7 @@ class Config:
             raise ValueError(f"OUTPUT_MODE must be 'udp' or 'http', got {mode}")
         return mode
 
-    @property
+    @cached_property
     def http_timeout(self) -> float:
         """HTTP request timeout in seconds.
 
@@ -169,7 +205,7 @@ class Config:
         """
         return float(os.getenv("HTTP_TIMEOUT", "1"))
 
-    @property
+    @cached_property
     def udp_port(self) -> int:
         """UDP DRGB protocol port.
 
@@ -190,7 +226,7 @@ class Config:
         return int(os.getenv("UDP_PORT", "21324"))
 
     # MQTT Configuration
-    @property
+    @cached_property
     def mqtt_broker(self) -> str:
         """MQTT broker hostname or IP address.
 
@@ -210,7 +246,7 @@ class Config:
         """
         return os.getenv("MQTT_BROKER", "localhost")
 
-    @property
+    @cached_property
     def mqtt_location(self) -> str:
         """Location name for espresense filtering.
 
@@ -233,7 +269,7 @@ class Config:
         """
         return os.getenv("MQTT_LOCATION", "balkon")
 
-    @property
+    @cached_property
     def mqtt_port(self) -> int:
         """MQTT broker port.
 
@@ -244,7 +280,7 @@ class Config:
         """
         return int(os.getenv("MQTT_PORT", "1883"))
 
-    @property
+    @cached_property
     def mqtt_username(self) -> str | None:
         """MQTT broker username for authentication.
 
@@ -266,7 +302,7 @@ class Config:
         """
         return os.getenv("MQTT_USERNAME")
 
-    @property
+    @cached_property
     def mqtt_password(self) -> str | None:
         """MQTT broker password for authentication.
 
@@ -280,7 +316,7 @@ class Config:
         return os.getenv("MQTT_PASSWORD")
 
     # Beacon State Configuration
-    @property
+    @cached_property
     def beacon_timeout_seconds(self) -> float:
         """Beacon timeout duration in seconds.
 
@@ -301,7 +337,7 @@ class Config:
         """
         return float(os.getenv("BEACON_TIMEOUT_SECONDS", "6.0"))
 
-    @property
+    @cached_property
     def beacon_fade_out_seconds(self) -> float:
         """Beacon fade-out duration in seconds.
 
@@ -315,7 +351,7 @@ class Config:
         return float(os.getenv("BEACON_FADE_OUT_SECONDS", "4.0"))
 
     # Animation Configuration
-    @property
+    @cached_property
     def update_interval(self) -> float:
         """LED update interval in seconds.
 
@@ -340,7 +376,7 @@ class Config:
         """
         return float(os.getenv("UPDATE_INTERVAL", "0.2"))
 
-    @property
+    @cached_property
     def trail_length(self) -> int:
         """Motion trail length in LEDs.
 
@@ -359,7 +395,7 @@ class Config:
         """
         return int(os.getenv("TRAIL_LENGTH", "10"))
 
-    @property
+    @cached_property
     def fade_factor(self) -> float:
         """Trail brightness fade factor per segment.
 
@@ -387,7 +423,7 @@ class Config:
         return fade
 
     # Logging Configuration
-    @property
+    @cached_property
     def log_level(self) -> str:
         """Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
 
@@ -446,22 +482,9 @@ class Config:
         _ = self.update_interval
         _ = self.trail_length
 
-    def to_dict(self) -> dict:
-        """Export configuration as dictionary.
-
-        Returns all configuration values as a dictionary. Useful for logging
-        or debugging configuration state.
-
-        Returns:
-            dict: Dictionary with all configuration values.
-
-        Example:
-            Log configuration on startup::
-
-                import json
-                config = Config('.env')
-                print(json.dumps(config.to_dict(), indent=2))
-        """
+    @cached_property
+    def _settings(self) -> dict:
+        """All configuration values, built once per instance for to_dict()."""
         return {
             # WLED
             "wled_host": self.wled_host,
@@ -485,3 +508,22 @@ class Config:
             # Logging
             "log_level": self.log_level,
         }
+
+    def to_dict(self) -> dict:
+        """Export configuration as dictionary.
+
+        Returns all configuration values as a dictionary. Useful for logging
+        or debugging configuration state. The values are collected once per
+        instance; each call returns a fresh copy that is safe to modify.
+
+        Returns:
+            dict: Dictionary with all configuration values.
+
+        Example:
+            Log configuration on startup::
+
+                import json
+                config = Config('.env')
+                print(json.dumps(config.to_dict(), indent=2))
+        """
+        return dict(self._settings)
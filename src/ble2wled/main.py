@@ -75,14 +75,14 @@ def run_wled_beacons(
     Each beacon is rendered at its current position with a fading trail effect.
 
     Algorithm:
-        1. Initialize LED array to black
+        1. Reset LED array to black (the buffer is reused between frames)
         2. Get snapshot of active beacons from beacon_state
         3. For each beacon:
            - Get next animation position
            - Convert beacon data (RSSI, life) to RGB color
            - Add trail effect behind beacon
         4. Send LED update to controller
-        5. Sleep for update_interval
+        5. Sleep until update_interval has passed since the previous frame
         6. Repeat
 
     Args:
@@ -115,16 +115,33 @@ def run_wled_beacons(
     """
     runner = BeaconRunner(led_count)
 
+    # Loop invariants: bound methods and a frame buffer cleared in place
+    next_position = runner.next_position
+    snapshot = beacon_state.snapshot
+    update = controller.update
+    leds = [[0, 0, 0] for _ in range(led_count)]
+    next_frame_time = time.monotonic()
+
     while True:
-        leds = [[0, 0, 0] for _ in range(led_count)]
+        for led in leds:
+            led[0] = led[1] = led[2] = 0
 
-        for beacon_id, (rssi, life) in beacon_state.snapshot().items():
-            pos = runner.next_position(beacon_id)
+        for beacon_id, (rssi, life) in snapshot().items():
+            pos = next_position(beacon_id)
             color = ble_beacon_to_rgb(beacon_id, rssi, life)
             add_trail(leds, pos, color, trail_length, fade_factor)
 
-        controller.update(leds)
-        time.sleep(update_interval)
+        update(leds)
+
+        # Sleep until the next frame is due so render and send time do not
+        # add to the frame period; after an overrun, restart the schedule
+        next_frame_time += update_interval
+        now = time.monotonic()
+        delay = next_frame_time - now
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            next_frame_time = now
 
 
 def main():
@@ -140,13 +157,14 @@ def main():
         2. Configure logging.
         3. Validate configuration parameters.
         4. Initialize beacon state tracking.
-        5. Start the Espresense MQTT listener.
-        6. Create a WLED controller (UDP or HTTP) based on configuration.
+        5. Create a WLED controller (UDP or HTTP) based on configuration.
+        6. Start the Espresense MQTT listener.
         7. Run the main beacon animation loop, updating the LED strip at
            configured intervals until interrupted.
 
     Raises:
         ValueError: If the configuration is invalid.
+        OSError: If the UDP controller cannot resolve the WLED host.
         KeyboardInterrupt: When the user interrupts the animation loop.
 
     Example:
@@ -179,24 +197,8 @@ def main():
         fade_out_seconds=config.beacon_fade_out_seconds,
     )
 
-    # Start espresense MQTT listener
-    mqtt_listener = EspresenseBeaconListener(
-        beacon_state,
-        config.mqtt_broker,
-        location=config.mqtt_location,
-        port=config.mqtt_port,
-        username=config.mqtt_username,
-        password=config.mqtt_password,
-    )
-    mqtt_listener.start()
-    logger.info(
-        "MQTT listener started for location '%s' on %s:%d",
-        config.mqtt_location,
-        config.mqtt_broker,
-        config.mqtt_port,
-    )
-
-    # Create WLED controller
+    # Create WLED controller before starting MQTT so a bad host leaves no
+    # listener thread running
     if config.output_mode == "udp":
         controller = WLEDUDPController(
             config.wled_host, config.led_count, port=config.udp_port
@@ -208,13 +210,35 @@ def main():
             config.led_count,
         )
     else:
-        controller = WLEDHTTPController(config.wled_host, config.led_count)
+        # Bound retries by the frame period so an outage cannot stall the loop
+        controller = WLEDHTTPController(
+            config.wled_host,
+            config.led_count,
+            retry_deadline=config.update_interval,
+        )
         logger.info(
             "Using WLED HTTP controller at %s with %d LEDs",
             config.wled_host,
             config.led_count,
         )
 
+    # Start espresense MQTT listener
+    mqtt_listener = EspresenseBeaconListener(
+        beacon_state,
+        config.mqtt_broker,
+        location=config.mqtt_location,
+        port=config.mqtt_port,
+        username=config.mqtt_username,
+        password=config.mqtt_password,
+    )
+    mqtt_listener.start()
+    logger.info(
+        "MQTT listener started for location '%s' on %s:%d",
+        config.mqtt_location,
+        config.mqtt_broker,
+        config.mqtt_port,
+    )
+
     # Run main animation loop
     logger.info("Starting animation loop with interval %.2fs", config.update_interval)
     try:
@@ -228,6 +252,8 @@ def main():
         )
     except KeyboardInterrupt:
         logger.info("Animation loop interrupted by user, exiting...")
+    finally:
+        mqtt_listener.stop()
 
 
 if __name__ == "__main__":
@@ -28,7 +28,6 @@ Example:
 
 import json
 import logging
-import threading
 from typing import TYPE_CHECKING
 
 import paho.mqtt.client as mqtt
@@ -42,8 +41,8 @@ logger = logging.getLogger(__name__)
 class EspresenseBeaconListener:
     """Listens for BLE beacon data from espresense MQTT broker.
 
-    Subscribes to espresense/devices/{beacon_id}/{location} topics and
-    filters for messages from a specific location. Extracts beacon ID and
+    Subscribes to espresense/devices/+/{location} topics so that only
+    messages from a specific location are delivered. Extracts beacon ID and
     RSSI from the topic and JSON payload.
 
     Attributes:
@@ -124,7 +123,7 @@ class EspresenseBeaconListener:
         """Handle MQTT connection.
 
         Called when the client connects to the broker. Subscribes to beacon
-        topics and logs connection status.
+        topics for the configured location and logs connection status.
 
         Args:
             client (mqtt.Client): MQTT client instance.
@@ -135,9 +134,10 @@ class EspresenseBeaconListener:
         Note:
             This is a callback method called by paho-mqtt library.
         """
-        # Subscribe to all devices at all locations
-        subscribe_topic = f"{self.base_topic}/+/+"
-        client.subscribe(subscribe_topic)
+        # Subscribe to all devices at our location only; the broker drops
+        # messages from other locations before they reach us
+        subscribe_topic = f"{self.base_topic}/+/{self.location}"
+        client.subscribe(subscribe_topic, qos=0)
         logger.info("Connected to MQTT broker, subscribed to %s", subscribe_topic)
 
     def on_message(
@@ -167,20 +167,20 @@ class EspresenseBeaconListener:
             This is a callback method called by paho-mqtt library.
         """
         try:
-            # Parse topic: espresense/devices/{beacon_id}/{location}
-            topic_parts = msg.topic.split("/")
-            if len(topic_parts) < 4:
-                return
-
-            location = topic_parts[-1]
-            beacon_id = topic_parts[-2]
+            # Parse topic from the right: {prefix}/{beacon_id}/{location},
+            # where prefix has at least two levels (espresense/devices)
+            head, _, location = msg.topic.rpartition("/")
 
             # Filter by location
             if location != self.location:
                 return
 
-            # Parse payload
-            payload = json.loads(msg.payload.decode())
+            prefix, _, beacon_id = head.rpartition("/")
+            if "/" not in prefix:
+                return
+
+            # Parse payload (json.loads decodes UTF-8 bytes itself)
+            payload = json.loads(msg.payload)
             beacon_id_payload = payload.get("id")
             rssi = payload.get("rssi")
 
@@ -213,8 +213,8 @@ class EspresenseBeaconListener:
     def start(self) -> None:
         """Start listening in background thread.
 
-        Starts the MQTT client loop in a background daemon thread. Blocks
-        until connection is established.
+        Starts paho-mqtt's own network loop thread, which handles incoming
+        messages and reconnects to the broker if the connection drops.
 
         Example:
             Start listening for beacons::
@@ -222,9 +222,21 @@ class EspresenseBeaconListener:
                 listener.start()
                 # Listener runs in background, updating beacon state
         """
-        threading.Thread(target=self.client.loop_forever, daemon=True).start()
+        self.client.loop_start()
         logger.debug("MQTT listener started for location %r", self.location)
 
+    def stop(self) -> None:
+        """Disconnect from the broker and stop the background thread.
+
+        Example:
+            Shut down the listener on exit::
+
+                listener.stop()
+        """
+        self.client.disconnect()
+        self.client.loop_stop()
+        logger.debug("MQTT listener stopped for location %r", self.location)
+
 
 # Backward compatibility alias
 BeaconMQTTListener = EspresenseBeaconListener
@@ -28,12 +28,35 @@ Example:
         )
 """
 
+import functools
 import math
+import sys
 import threading
+import time
+from collections.abc import Callable
 
 from .wled import LEDController
 
 
+@functools.lru_cache(maxsize=4096)
+def _ansi_cell(r: int, g: int, b: int) -> str:
+    """Return the terminal cell for one LED color.
+
+    Animations reuse a small palette of trail shades, so the formatted
+    escape sequences are cached instead of being rebuilt every frame.
+
+    Args:
+        r (int): Red value (0-255).
+        g (int): Green value (0-255).
+        b (int): Blue value (0-255).
+
+    Returns:
+        str: Colored block using a 24-bit ANSI foreground color, followed by
+            a color reset and spacing.
+    """
+    return f"\033[38;2;{r};{g};{b}m█\033[0m  "
+
+
 class LEDSimulator(LEDController):
     """LED strip simulator with visual terminal output.
 
@@ -49,8 +72,11 @@ class LEDSimulator(LEDController):
         led_count (int): Total number of LEDs.
         rows (int): Number of rows in display grid.
         cols (int): Number of columns in display grid.
-        current_leds (List[List[int]]): Current LED RGB values.
-        lock (threading.Lock): Thread-safe access to LED data.
+        current_leds (List[List[int]]): Current LED RGB values. Each update
+            publishes a fresh list that is never mutated afterwards, so
+            readers can use the reference without locking.
+        lock (threading.Lock): Serializes frame publication and terminal
+            output in update().
 
     Example:
         Create a 10x6 grid simulator::
@@ -60,7 +86,14 @@ class LEDSimulator(LEDController):
             simulator.update(leds)
     """
 
-    def __init__(self, led_count: int = 60, rows: int = 10, cols: int = 6):
+    def __init__(
+        self,
+        led_count: int = 60,
+        rows: int = 10,
+        cols: int = 6,
+        full_repaint_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         """Initialize the LED simulator.
 
         Args:
@@ -68,6 +101,12 @@ class LEDSimulator(LEDController):
                 Must equal rows x cols.
             rows (int): Number of rows in display grid. Default: 10.
             cols (int): Number of columns in display grid. Default: 6.
+            full_repaint_interval (float): Seconds after which the whole grid
+                is redrawn even if only some cells changed, so output from
+                other sources or a terminal resize cannot corrupt the display
+                for good. Default: 1.0.
+            clock (Callable[[], float]): Monotonic time source in seconds.
+                Default is time.monotonic; tests can inject a fake clock.
 
         Raises:
             ValueError: If rows x cols does not equal led_count.
@@ -90,12 +129,20 @@ class LEDSimulator(LEDController):
         self.current_leds: list[list[int]] = [[0, 0, 0] for _ in range(led_count)]
         self.lock = threading.Lock()
         self._running = False
+        self._rendered = False
+        self.full_repaint_interval = full_repaint_interval
+        self._clock = clock
+        # Frame currently shown in the terminal; None forces a full repaint
+        self._screen: list[list[int]] | None = None
+        self._next_full_repaint = 0.0
 
     def update(self, leds: list[list[int]]) -> None:
         """Update and display the LED strip.
 
         Updates the current LED state and renders the grid to terminal.
-        Uses ANSI 24-bit true color escape codes for each LED.
+        Uses ANSI 24-bit true color escape codes for each LED. The terminal
+        is not redrawn when the frame is identical to the one on screen,
+        unless a full repaint is due.
 
         Args:
             leds (List[List[int]]): LED data as list of [R, G, B] triplets.
@@ -115,52 +162,150 @@ class LEDSimulator(LEDController):
                     time.sleep(0.05)
         """
         with self.lock:
-            self.current_leds = [list(led) for led in leds]
+            # Compare before copying so unchanged frames allocate nothing
+            if not self._rendered or leds != self.current_leds:
+                self.current_leds = [list(led) for led in leds]
+                self._rendered = True
+            elif not self._full_repaint_due():
+                return
+
+            # Render under the lock so concurrent updates cannot pick
+            # conflicting diff bases or interleave their cursor sequences
+            self._render()
+
+    def invalidate(self) -> None:
+        """Clear the terminal and redraw the whole grid on the next update.
+
+        Example:
+            Start over after other output has scrolled the grid away::
+
+                simulator.invalidate()
+                simulator.update(leds)
+        """
+        with self.lock:
+            self._screen = None
 
-        self._render()
+    def _full_repaint_due(self) -> bool:
+        """Return True if the next render must redraw the whole grid."""
+        return self._screen is None or self._clock() >= self._next_full_repaint
 
     def _render(self) -> None:
         """Render the LED grid to terminal.
 
-        Clears the terminal and displays the LED grid as a table of colored
-        squares using ANSI 24-bit color codes. Each LED is represented by
-        a colored space character.
+        Must be called with ``self.lock`` held.
+
+        The first frame clears the terminal and draws the whole grid as a
+        table of colored squares using ANSI 24-bit color codes. Later frames
+        only repaint the cells whose color changed, plus the footer line.
+        Every ``full_repaint_interval`` seconds the whole grid is redrawn in
+        place, without clearing the screen, so stray terminal output cannot
+        corrupt the display for good.
 
         Uses terminal escape sequences:
         - Clear screen: \\033[H\\033[J
         - Set color: \\033[38;2;R;G;Bm (foreground)
         - Reset color: \\033[0m
-        - Cursor position: \\033[H
+        - Cursor position: \\033[H, \\033[<row>;<col>H
+        - Clear line: \\033[K
         """
-        with self.lock:
-            # Clear screen and move cursor to top-left
-            print("\033[H\033[J", end="", flush=True)
+        leds = self.current_leds
+        previous = self._screen
+        now = self._clock()
+
+        if previous is None or len(previous) != len(leds):
+            output = self._full_frame(leds, clear=True)
+            self._next_full_repaint = now + self.full_repaint_interval
+        elif now >= self._next_full_repaint:
+            output = self._full_frame(leds, clear=False)
+            self._next_full_repaint = now + self.full_repaint_interval
+        else:
+            output = self._frame_diff(previous, leds)
+        self._screen = leds
+
+        # Emit the whole update with a single write
+        sys.stdout.write(output)
+        sys.stdout.flush()
+
+    def _full_frame(self, leds: list[list[int]], clear: bool = True) -> str:
+        """Build the terminal output that draws the complete grid.
+
+        Args:
+            leds (List[List[int]]): Frame to draw.
+            clear (bool): Clear the whole screen first. When False the grid
+                is redrawn in place: each line is cleared to its end and
+                everything below the line after the footer is erased, so a
+                status line printed there by the caller survives.
+                Default: True.
+
+        Returns:
+            str: Header, LED grid and footer. The cursor ends on the line
+            below the footer.
+        """
+        cols = self.cols
+        border = "=" * (cols * 4 + 2)
+
+        # Move cursor to top-left (clearing the screen) and print header
+        lines = [
+            "LED Strip Simulator - Press Ctrl+C to exit",
+            border,
+        ]
+
+        # LED grid: one colored block per LED
+        for start in range(0, self.rows * cols, cols):
+            lines.append(
+                "".join([_ansi_cell(*led) for led in leds[start : start + cols]])
+            )
+
+        # Footer with stats
+        lines.append(border)
+        lines.append(self._footer(leds))
 
-            # Print header
-            print("LED Strip Simulator - Press Ctrl+C to exit")
-            print("=" * (self.cols * 4 + 2))
+        if clear:
+            return "\033[H\033[J" + "\n".join(lines) + "\n"
+
+        status_row = self.rows + 5
+        return (
+            "\033[H"
+            + "\033[K\n".join(lines)
+            + f"\033[K\n\033[{status_row + 1};1H\033[J\033[{status_row};1H"
+        )
 
-            # Print LED grid
-            for row in range(self.rows):
-                for col in range(self.cols):
-                    led_idx = row * self.cols + col
-                    r, g, b = self.current_leds[led_idx]
+    def _frame_diff(self, previous: list[list[int]], leds: list[list[int]]) -> str:
+        """Build the terminal output that repaints only changed cells.
 
-                    # ANSI 24-bit color code for foreground
-                    color_code = f"\033[38;2;{r};{g};{b}m"
-                    reset_code = "\033[0m"
+        Args:
+            previous (List[List[int]]): Frame currently on screen.
+            leds (List[List[int]]): Frame to draw.
 
-                    # Print colored block (use block character for better visibility)
-                    print(f"{color_code}█{reset_code}  ", end="")
+        Returns:
+            str: Cursor moves and colored cells for every changed LED, then
+            the rewritten footer. The cursor ends on the line below the
+            footer, as after a full frame.
+        """
+        cols = self.cols
+        parts = []
+        for i, (led, old) in enumerate(zip(leds, previous, strict=True)):
+            if led != old:
+                # Grid starts on terminal row 3; each cell is 3 columns wide
+                row, col = divmod(i, cols)
+                parts.append(f"\033[{row + 3};{col * 3 + 1}H{_ansi_cell(*led)}")
+
+        footer_row = self.rows + 4
+        parts.append(f"\033[{footer_row};1H\033[K{self._footer(leds)}\n")
+        return "".join(parts)
+
+    @staticmethod
+    def _footer(leds: list[list[int]]) -> str:
+        """Format the average brightness footer line.
 
-                print()  # Newline after each row
+        Args:
+            leds (List[List[int]]): Frame to summarize.
 
-            # Print footer with stats
-            print("=" * (self.cols * 4 + 2))
-            avg_brightness = sum(
-                (r + g + b) // 3 for r, g, b in self.current_leds
-            ) / len(self.current_leds)
-            print(f"Average brightness: {avg_brightness:.1f}/255")
+        Returns:
+            str: Footer text without trailing newline.
+        """
+        avg_brightness = sum((r + g + b) // 3 for r, g, b in leds) / len(leds)
+        return f"Average brightness: {avg_brightness:.1f}/255"
 
     def get_snapshot(self) -> list[list[int]]:
         """Get current LED state.
@@ -174,8 +319,7 @@ class LEDSimulator(LEDController):
                 leds = simulator.get_snapshot()
                 print(f"LED 0 color: RGB{tuple(leds[0])}")
         """
-        with self.lock:
-            return [list(led) for led in self.current_leds]
+        return [list(led) for led in self.current_leds]
 
 
 class MockBeaconGenerator:
@@ -229,6 +373,11 @@ class MockBeaconGenerator:
             for i, bid in enumerate(self.beacon_ids)
         }
         self._time = 0.0
+        # Per-beacon (index, id, phase) and RSSI span, fixed for the lifetime
+        self._beacon_phases = [
+            (i, bid, i / num_beacons) for i, bid in enumerate(self.beacon_ids)
+        ]
+        self._rssi_span = rssi_range[1] - rssi_range[0]
 
     def update(self, time_delta: float = 0.1) -> dict:
         """Update beacon positions and signal strengths.
@@ -253,20 +402,22 @@ class MockBeaconGenerator:
                     time.sleep(0.05)
         """
         self._time += time_delta
+        t = self._time
+        cycle = t / 10.0
+        wobble = t * 2
+        rssi_min = self.rssi_range[0]
+        span = self._rssi_span
         beacons = {}
 
-        for i, beacon_id in enumerate(self.beacon_ids):
+        for i, beacon_id, phase in self._beacon_phases:
             # Circular motion: beacon moves around circle over time
-            angle = 2 * math.pi * (self._time / 10.0 + i / self.num_beacons)
+            angle = 2 * math.pi * (cycle + phase)
             pos = 0.5 + 0.4 * math.cos(angle)
 
             # Signal strength varies with position (closer = stronger)
             # Add some noise for realism
-            noise = 3 * math.sin(self._time * 2 + i)
-            rssi_base = self.rssi_range[0] + pos * (
-                self.rssi_range[1] - self.rssi_range[0]
-            )
-            rssi = rssi_base + noise
+            noise = 3 * math.sin(wobble + i)
+            rssi = rssi_min + pos * span + noise
 
             beacons[beacon_id] = int(rssi)
 
@@ -16,6 +16,7 @@ Example:
 
 import threading
 import time
+from collections.abc import Callable
 
 
 class BeaconState:
@@ -30,7 +31,14 @@ class BeaconState:
         fade_out (float): Seconds to fade out after timeout.
     """
 
-    def __init__(self, timeout_seconds: float = 5.0, fade_out_seconds: float = 3.0):
+    __slots__ = ("_lock", "_clock", "timeout", "fade_out", "_beacons")
+
+    def __init__(
+        self,
+        timeout_seconds: float = 5.0,
+        fade_out_seconds: float = 3.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         """Initialize beacon state tracker.
 
         Args:
@@ -38,6 +46,8 @@ class BeaconState:
                 timed out (no updates received). Default is 5.0 seconds.
             fade_out_seconds (float): Duration to fade out the beacon after
                 timeout. Default is 3.0 seconds.
+            clock (Callable[[], float]): Monotonic time source in seconds.
+                Default is time.monotonic; tests can inject a fake clock.
 
         Example:
             Create a beacon state tracker with 6-second timeout and 4-second fade::
@@ -45,9 +55,11 @@ class BeaconState:
                 state = BeaconState(timeout_seconds=6.0, fade_out_seconds=4.0)
         """
         self._lock = threading.Lock()
+        self._clock = clock
         self.timeout = timeout_seconds
         self.fade_out = fade_out_seconds
-        self._beacons: dict[str, dict] = {}
+        # beacon_id -> (rssi, last_seen); life is derived in snapshot()
+        self._beacons: dict[str, tuple[int, float]] = {}
 
     def update(self, beacon_id: str, rssi: int) -> None:
         """Update beacon with signal strength.
@@ -66,13 +78,9 @@ class BeaconState:
 
                 state.update('beacon_1', -50)  # Update beacon_1 with -50 dBm
         """
-        now = time.time()
+        now = self._clock()
         with self._lock:
-            self._beacons[beacon_id] = {
-                "rssi": rssi,
-                "last_seen": now,
-                "life": 1.0,
-            }
+            self._beacons[beacon_id] = (rssi, now)
 
     def snapshot(self) -> dict[str, tuple[int, float]]:
         """Get current active beacons with RSSI and life values.
@@ -94,25 +102,25 @@ class BeaconState:
                     rssi, life = beacons['beacon_1']
                     print(f"Beacon 1: {rssi} dBm, {life*100:.0f}% visible")
         """
-        now = time.time()
+        now = self._clock()
         active = {}
 
         with self._lock:
             to_remove = []
 
-            for beacon_id, data in self._beacons.items():
-                age = now - data["last_seen"]
+            for beacon_id, (rssi, last_seen) in self._beacons.items():
+                age = now - last_seen
 
                 if age <= self.timeout:
-                    data["life"] = 1.0
+                    life = 1.0
                 else:
                     decay = (age - self.timeout) / self.fade_out
-                    data["life"] = max(0.0, 1.0 - decay)
+                    life = max(0.0, 1.0 - decay)
 
-                if data["life"] <= 0.0:
+                if life <= 0.0:
                     to_remove.append(beacon_id)
                 else:
-                    active[beacon_id] = (data["rssi"], data["life"])
+                    active[beacon_id] = (rssi, life)
 
             for beacon_id in to_remove:
                 del self._beacons[beacon_id]
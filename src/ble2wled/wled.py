@@ -17,6 +17,9 @@ Example:
         controller.update(leds)
 """
 
+import errno
+import itertools
+import json
 import logging
 import socket
 import time
@@ -26,6 +29,12 @@ import requests
 
 logger = logging.getLogger(__name__)
 
+# Send errors that mean the device is unreachable right now; the frame is
+# dropped and the next one retries. Anything else is a real error.
+_UDP_OUTAGE_ERRNOS = frozenset(
+    {errno.ECONNREFUSED, errno.EHOSTUNREACH, errno.ENETUNREACH}
+)
+
 
 class LEDController(ABC):
     """Abstract base class for LED controllers.
@@ -67,10 +76,12 @@ class WLEDHTTPController(LEDController):
     """WLED controller using HTTP API.
 
     Sends LED updates via WLED's JSON HTTP API. Slower than UDP but more
-    reliable and easier to debug.
+    reliable and easier to debug. Requests go through a persistent
+    ``requests.Session`` so the TCP connection is kept alive between frames.
 
     Implements automatic retry logic for handling temporary connection failures
-    and timeouts.
+    and timeouts. Retries back off exponentially and can be bounded by a
+    per-frame deadline, so a struggling device does not stall the animation.
 
     Example:
         Use HTTP controller::
@@ -80,7 +91,14 @@ class WLEDHTTPController(LEDController):
             controller.update(leds)
     """
 
-    def __init__(self, host: str, led_count: int, max_retries: int = 3):
+    def __init__(
+        self,
+        host: str,
+        led_count: int,
+        max_retries: int = 3,
+        retry_deadline: float | None = None,
+        retry_backoff: float = 0.02,
+    ):
         """Initialize HTTP controller.
 
         Args:
@@ -88,18 +106,39 @@ class WLEDHTTPController(LEDController):
             led_count (int): Total number of LEDs in the strip.
             max_retries (int): Maximum number of retry attempts on timeout.
                 Default: 3.
+            retry_deadline (float, optional): Seconds one update may spend
+                including retries. A retry whose backoff would end past the
+                deadline is skipped and the frame is dropped, since the next
+                frame supersedes it anyway. Default: None (no deadline).
+            retry_backoff (float): Seconds to sleep before the first retry;
+                the delay doubles for each further one. Default: 0.02, so
+                the two retries of the default ``max_retries`` sleep 0.06 s
+                in total and fit inside a typical 0.1 s frame.
+
+        Example:
+            Never let one frame block for longer than 100 ms of retries::
+
+                controller = WLEDHTTPController(
+                    'wled.local', 60, retry_deadline=0.1
+                )
         """
         super().__init__(host, led_count)
         self.url = f"http://{host}/json/state"
         self.max_retries = max_retries
+        self.retry_deadline = retry_deadline
+        self.retry_backoff = retry_backoff
         self.timeout = 1
+        # Persistent session so frames reuse one keep-alive connection
+        self.session = requests.Session()
+        self.session.headers["Content-Type"] = "application/json"
 
     def update(self, leds: list[list[int]]) -> None:
         """Send LED update via HTTP POST with retry logic.
 
         Sends LED data to WLED device using the /json/state endpoint.
         Automatically retries on timeout errors to handle temporary
-        connection issues.
+        connection issues, sleeping ``retry_backoff`` seconds before the
+        first retry and doubling the delay for each further one.
 
         Args:
             leds (list): List of RGB color values [R, G, B] 0-255.
@@ -110,11 +149,21 @@ class WLEDHTTPController(LEDController):
                 leds = [[255, 0, 0] for _ in range(60)]  # All red
                 controller.update(leds)
         """
-        payload = {"on": True, "seg": [{"id": 0, "i": leds}]}
+        # WLED accepts "RRGGBB" hex strings in "i", about half the size of
+        # [r, g, b] triplets on the wire
+        hex_data = bytes(itertools.chain.from_iterable(leds)).hex()
+        colors = [hex_data[i : i + 6] for i in range(0, len(hex_data), 6)]
+        payload = {"on": True, "seg": [{"id": 0, "i": colors}]}
+        # Encode once, compactly, so retries resend the same body
+        body = json.dumps(payload, separators=(",", ":"))
+
+        deadline = None
+        if self.retry_deadline is not None:
+            deadline = time.monotonic() + self.retry_deadline
 
         for attempt in range(self.max_retries):
             try:
-                response = requests.post(self.url, json=payload, timeout=self.timeout)
+                response = self.session.post(self.url, data=body, timeout=self.timeout)
                 response.raise_for_status()
                 return  # Success
             except (
@@ -122,23 +171,28 @@ class WLEDHTTPController(LEDController):
                 requests.exceptions.ReadTimeout,
                 requests.exceptions.ConnectionError,
             ) as e:
-                if attempt < self.max_retries - 1:
+                # Back off before retrying to allow device to recover
+                delay = self.retry_backoff * 2**attempt
+                out_of_time = deadline is not None and (
+                    time.monotonic() + delay >= deadline
+                )
+                if attempt < self.max_retries - 1 and not out_of_time:
                     logger.warning(
                         "HTTP timeout on attempt %d/%d for %s, retrying...",
                         attempt + 1,
                         self.max_retries,
                         self.host,
                     )
-                    # Brief sleep before retry to allow device to recover
-                    time.sleep(0.05)
+                    time.sleep(delay)
                 else:
                     logger.error(
                         "HTTP request failed after %d attempts for %s: %s",
-                        self.max_retries,
+                        attempt + 1,
                         self.host,
                         e,
                     )
                     # Don't raise - allow animation to continue even if device is unreachable
+                    return
             except requests.exceptions.RequestException as e:
                 logger.error("HTTP request error for %s: %s", self.host, e)
                 # Don't raise on other request errors - allow animation to continue
@@ -154,6 +208,10 @@ class WLEDUDPController(LEDController):
         - Header: 'DRGB' (4 bytes)
         - Data: RGB triplets (3 bytes per LED)
 
+    The socket is connected to the device once on creation, so the host name
+    is resolved a single time and each frame is a plain ``send``. A failing
+    device is reported once per outage rather than on every frame.
+
     Example:
         Use UDP controller for real-time updates::
 
@@ -170,6 +228,9 @@ class WLEDUDPController(LEDController):
             led_count (int): Total number of LEDs in the strip.
             port (int): DRGB protocol port. Default: 21324.
 
+        Raises:
+            OSError: If the host name cannot be resolved.
+
         Example:
             Create UDP controller with custom port::
 
@@ -178,26 +239,45 @@ class WLEDUDPController(LEDController):
         super().__init__(host, led_count)
         self.addr = (host, port)
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.connect(self.addr)
+        self._send_failed = False
 
     def update(self, leds: list[list[int]]) -> None:
         """Send LED update via UDP DRGB protocol.
 
         Constructs DRGB packet with header and RGB data, sends via UDP.
-        No response is expected or required.
+        No response is expected or required. If the device is unreachable
+        (connection refused, host or network unreachable) the frame is
+        dropped; the first failure of an outage is logged as a warning and
+        recovery is logged once it ends.
 
         Args:
             leds (list): List of RGB color values [R, G, B] 0-255.
 
+        Raises:
+            OSError: For send errors other than an unreachable device, such
+                as a packet too large for the network.
+
         Example:
             Update LEDs via UDP::
 
                 leds = [[255, 0, 255] for _ in range(60)]  # All magenta
                 controller.update(leds)
         """
-        # DRGB header
+        # DRGB header followed by the flattened RGB triplets
         packet = bytearray(b"DRGB")
-
-        for r, g, b in leds:
-            packet.extend(bytes((r, g, b)))
-
-        self.sock.sendto(packet, self.addr)
+        packet.extend(itertools.chain.from_iterable(leds))
+
+        try:
+            self.sock.send(packet)
+        except OSError as e:
+            if e.errno not in _UDP_OUTAGE_ERRNOS:
+                raise
+            if not self._send_failed:
+                self._send_failed = True
+                logger.warning("UDP send to %s failed: %s", self.host, e)
+            return
+
+        if self._send_failed:
+            self._send_failed = False
+            logger.info("UDP send to %s recovered", self.host)
@@ -24,6 +24,11 @@ class TestBeaconRunnerComprehensive:
         runner = BeaconRunner(led_count=60)
         assert not runner.positions
 
+    def test_uses_slots(self):
+        """Test that BeaconRunner instances have no per-instance __dict__."""
+        runner = BeaconRunner(led_count=60)
+        assert not hasattr(runner, "__dict__")
+
     def test_next_position_returns_integer(self):
         """Test that next_position returns integer values."""
         runner = BeaconRunner(led_count=10)
@@ -231,6 +236,47 @@ class TestAddTrail:
         # Positions wrap and accumulate
         assert leds[4][0] > 0
 
+    def test_add_trail_position_outside_strip(self):
+        """Test that out-of-range positions wrap like a modulo index."""
+        expected = [[0, 0, 0] for _ in range(10)]
+        add_trail(
+            expected, position=2, color=(100, 0, 0), trail_length=4, fade_factor=0.5
+        )
+
+        for position in (12, -8):
+            leds = [[0, 0, 0] for _ in range(10)]
+            add_trail(
+                leds,
+                position=position,
+                color=(100, 0, 0),
+                trail_length=4,
+                fade_factor=0.5,
+            )
+            assert leds == expected
+
+    def test_add_trail_empty_strip_is_noop(self):
+        """Test that an empty LED list is left alone instead of raising."""
+        for trail_length in (0, 3):
+            leds = []
+
+            add_trail(
+                leds,
+                position=5,
+                color=(255, 0, 0),
+                trail_length=trail_length,
+                fade_factor=0.5,
+            )
+
+            assert not leds
+
+    def test_add_trail_zero_length_is_noop(self):
+        """Test that a zero-length trail leaves the strip unchanged."""
+        leds = [[0, 0, 0] for _ in range(4)]
+
+        add_trail(leds, position=1, color=(255, 0, 0), trail_length=0, fade_factor=0.5)
+
+        assert leds == [[0, 0, 0] for _ in range(4)]
+
     def test_add_trail_trail_length_one(self):
         """Test with trail length of 1 (just the point)."""
         leds = [[0, 0, 0] for _ in range(10)]
@@ -372,6 +418,18 @@ class TestAddTrail:
         assert leds[4][0] == int(100 * 0.33)
         assert leds[3][0] == int(100 * (0.33**2))
 
+    def test_add_trail_fade_parameters_change_between_calls(self):
+        """Test that cached fade tables do not leak across parameter changes."""
+        leds = [[0, 0, 0] for _ in range(10)]
+        add_trail(leds, position=5, color=(200, 0, 0), trail_length=2, fade_factor=0.5)
+
+        leds = [[0, 0, 0] for _ in range(10)]
+        add_trail(leds, position=5, color=(200, 0, 0), trail_length=3, fade_factor=0.25)
+
+        assert leds[5][0] == 200
+        assert leds[4][0] == 50
+        assert leds[3][0] == 12
+
 
 class TestAnimationIntegration:
     """Integration tests for BeaconRunner and add_trail."""
@@ -1,10 +1,24 @@
 """Tests for BeaconState class."""
 
 import time
+from unittest.mock import patch
 
 from ble2wled.states import BeaconState
 
 
+class FakeClock:
+    """Manually advanced clock for driving BeaconState timing."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
 class TestBeaconState:
     """Test cases for BeaconState."""
 
@@ -14,6 +28,11 @@ class TestBeaconState:
         assert state.timeout == 5.0
         assert state.fade_out == 3.0
 
+    def test_uses_slots(self):
+        """Test that BeaconState instances have no per-instance __dict__."""
+        state = BeaconState()
+        assert not hasattr(state, "__dict__")
+
     def test_update_beacon(self):
         """Test updating a beacon."""
         state = BeaconState()
@@ -27,7 +46,8 @@ class TestBeaconState:
 
     def test_beacon_timeout(self):
         """Test beacon timeout and fade out."""
-        state = BeaconState(timeout_seconds=0.1, fade_out_seconds=0.2)
+        clock = FakeClock()
+        state = BeaconState(timeout_seconds=0.1, fade_out_seconds=0.2, clock=clock)
         state.update("beacon_1", -50)
 
         # Beacon should be active initially
@@ -35,8 +55,8 @@ class TestBeaconState:
         assert "beacon_1" in snapshot
         assert snapshot["beacon_1"][1] == 1.0
 
-        # Wait for timeout
-        time.sleep(0.15)
+        # Advance past the timeout
+        clock.advance(0.15)
         snapshot = state.snapshot()
         assert "beacon_1" in snapshot
         rssi, life = snapshot["beacon_1"]
@@ -45,11 +65,12 @@ class TestBeaconState:
 
     def test_beacon_removal(self):
         """Test beacon removal after fade out."""
-        state = BeaconState(timeout_seconds=0.1, fade_out_seconds=0.1)
+        clock = FakeClock()
+        state = BeaconState(timeout_seconds=0.1, fade_out_seconds=0.1, clock=clock)
         state.update("beacon_1", -50)
 
-        # Wait for complete fade out
-        time.sleep(0.25)
+        # Advance past complete fade out
+        clock.advance(0.25)
         snapshot = state.snapshot()
         assert "beacon_1" not in snapshot
 
@@ -65,3 +86,24 @@ class TestBeaconState:
         assert "beacon_1" in snapshot
         assert "beacon_2" in snapshot
         assert "beacon_3" in snapshot
+
+    def test_ignores_wall_clock_jumps(self):
+        """Test beacon ageing is unaffected by wall-clock adjustments."""
+        state = BeaconState(timeout_seconds=5.0, fade_out_seconds=3.0)
+        state.update("beacon_1", -50)
+
+        # Simulate the system clock jumping forward by an hour
+        with patch("time.time", return_value=time.time() + 3600):
+            snapshot = state.snapshot()
+
+        assert snapshot["beacon_1"] == (-50, 1.0)
+
+    def test_life_follows_injected_clock(self):
+        """Test that life decays linearly with the injected clock."""
+        clock = FakeClock()
+        state = BeaconState(timeout_seconds=5.0, fade_out_seconds=4.0, clock=clock)
+        state.update("beacon_1", -50)
+
+        clock.advance(7.0)
+
+        assert state.snapshot() == {"beacon_1": (-50, 0.5)}
@@ -9,17 +9,21 @@ Comprehensive tests for the cli_simulator module covering:
 """
 # ruff: noqa: I001
 
+import itertools
 import signal
 import sys
-import threading
 import time
-from unittest.mock import MagicMock, patch
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
+from ble2wled import cli_simulator as cs
 from ble2wled.cli_simulator import (
     MQTTStatistics,
     StatisticsTrackingBeaconState,
+    cli,
     handle_interrupt,
     main,
 )
@@ -112,25 +116,36 @@ class TestMQTTStatistics:
             result["rate"] <= result["total"] / result["elapsed"] * 1.1
         )  # Allow 10% margin
 
-    def test_record_message_thread_safety(self):
-        """Test that recording messages is thread-safe."""
+    def test_get_stats_uses_monotonic_elapsed(self, monkeypatch):
+        """Test that rate is measured on the monotonic clock."""
+        monkeypatch.setattr(cs.time, "monotonic", lambda: 100.0)
         stats = MQTTStatistics()
+        stats.record_message("beacon_001")
+        stats.record_message("beacon_001")
+
+        monkeypatch.setattr(cs.time, "monotonic", lambda: 104.0)
+        result = stats.get_stats()
 
-        def record_messages(beacon_id, count):
-            for _ in range(count):
-                stats.record_message(beacon_id)
+        assert result["elapsed"] == 4.0
+        assert result["rate"] == 0.5
 
-        threads = [
-            threading.Thread(target=record_messages, args=(f"beacon_{i}", 10))
-            for i in range(5)
-        ]
+    @pytest.mark.parametrize(
+        ("threads", "per_thread"),
+        [pytest.param(5, 10, id="5x10"), pytest.param(16, 100, id="16x100")],
+    )
+    def test_record_message_thread_safety(self, threads, per_thread):
+        """Test that recording messages is thread-safe."""
+        stats = MQTTStatistics()
 
-        for thread in threads:
-            thread.start()
-        for thread in threads:
-            thread.join()
+        def record_messages(index):
+            for _ in range(per_thread):
+                stats.record_message(f"beacon_{index}")
 
-        assert stats.total_messages == 50
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(record_messages, range(threads)))
+
+        assert stats.total_messages == threads * per_thread
+        assert set(stats.messages_by_beacon.values()) == {per_thread}
 
 
 class TestStatisticsTrackingBeaconState:
@@ -202,227 +217,167 @@ class TestHandleInterrupt:
         assert exc_info.value.code == 0
 
 
+# Frame timestamps that let duration-limited main() runs terminate
+_TIME_CYCLE_VALUES = (0.0, 0.0, 0.06, 0.12)
+
+
+def _time_cycle():
+    """Return an endless iterator over the standard frame timestamps."""
+    return itertools.cycle(_TIME_CYCLE_VALUES)
+
+
+def _set_argv(monkeypatch, *args):
+    """Replace ``sys.argv`` with ``args`` for the duration of a test."""
+    monkeypatch.setattr(sys, "argv", list(args))
+
+
+@pytest.fixture
+def cli_mocks(monkeypatch):
+    """Patch the collaborators of main() and return them as one namespace.
+
+    The clock cycles through frame timestamps so duration-limited runs stop,
+    and both beacon state classes return the same mock with an empty
+    snapshot. Tests override only what they need.
+    """
+    mocks = SimpleNamespace(
+        monotonic=MagicMock(side_effect=_time_cycle()),
+        sleep=MagicMock(),
+        simulator_cls=MagicMock(),
+        beacon_runner_cls=MagicMock(),
+        beacon_state_cls=MagicMock(),
+        stats_state_cls=MagicMock(),
+        generator_cls=MagicMock(),
+        mqtt_listener_cls=MagicMock(),
+    )
+    mocks.simulator = mocks.simulator_cls.return_value
+    mocks.beacon_runner = mocks.beacon_runner_cls.return_value
+    mocks.beacon_runner.next_position.return_value = 0
+    mocks.beacon_state = mocks.beacon_state_cls.return_value
+    mocks.beacon_state.snapshot.return_value = {}
+    mocks.stats_state_cls.return_value = mocks.beacon_state
+    mocks.generator = mocks.generator_cls.return_value
+    mocks.generator.update.return_value = {}
+    mocks.mqtt_listener = mocks.mqtt_listener_cls.return_value
+
+    monkeypatch.setattr(cs.time, "monotonic", mocks.monotonic)
+    monkeypatch.setattr(cs.time, "sleep", mocks.sleep)
+    monkeypatch.setattr(cs, "LEDSimulator", mocks.simulator_cls)
+    monkeypatch.setattr(cs, "BeaconRunner", mocks.beacon_runner_cls)
+    monkeypatch.setattr(cs, "BeaconState", mocks.beacon_state_cls)
+    monkeypatch.setattr(cs, "StatisticsTrackingBeaconState", mocks.stats_state_cls)
+    monkeypatch.setattr(cs, "MockBeaconGenerator", mocks.generator_cls)
+    monkeypatch.setattr(cs, "EspresenseBeaconListener", mocks.mqtt_listener_cls)
+    return mocks
+
+
 class TestMainFunction:
     """Tests for main() function."""
 
-    @patch("ble2wled.cli_simulator.LEDSimulator")
-    @patch("ble2wled.cli_simulator.BeaconRunner")
-    @patch("ble2wled.cli_simulator.BeaconState")
-    @patch("ble2wled.cli_simulator.time.sleep")
-    @patch("ble2wled.cli_simulator.time.time")
-    def test_main_with_default_parameters(
-        self,
-        mock_time,
-        mock_sleep,  # pylint: disable=unused-argument
-        mock_beacon_state_cls,
-        mock_beacon_runner_cls,
-        mock_simulator_cls,
-    ):
-        """Test main with default parameters."""
-        # Setup mocks
-        mock_time.side_effect = [0, 0.1, 0.2, 0.3]  # For duration check
-        mock_beacon_state = MagicMock()
-        mock_beacon_state.snapshot.return_value = {}
-        mock_beacon_state_cls.return_value = mock_beacon_state
-
-        mock_simulator = MagicMock()
-        mock_simulator_cls.return_value = mock_simulator
-
-        mock_beacon_runner = MagicMock()
-        mock_beacon_runner_cls.return_value = mock_beacon_runner
-
-        # Run with duration to avoid infinite loop
-        main(duration=0.05)
-
-        # Verify components were created
-        mock_simulator_cls.assert_called_once_with(led_count=60, rows=10, cols=6)
-        mock_beacon_state_cls.assert_called_once()
-        mock_beacon_runner_cls.assert_called_once_with(60)
-
-    @patch("ble2wled.cli_simulator.LEDSimulator")
-    @patch("ble2wled.cli_simulator.BeaconRunner")
-    @patch("ble2wled.cli_simulator.BeaconState")
-    @patch("ble2wled.cli_simulator.time.sleep")
-    @patch("ble2wled.cli_simulator.time.time")
-    def test_main_with_custom_led_count(
-        self,
-        mock_time,
-        mock_sleep,  # pylint: disable=unused-argument
-        mock_beacon_state_cls,
-        mock_beacon_runner_cls,
-        mock_simulator_cls,
-    ):
-        """Test main with custom LED count."""
-        mock_time.side_effect = [0, 0.1, 0.2]
-        mock_beacon_state = MagicMock()
-        mock_beacon_state.snapshot.return_value = {}
-        mock_beacon_state_cls.return_value = mock_beacon_state
-        mock_simulator = MagicMock()
-        mock_simulator_cls.return_value = mock_simulator
-        mock_beacon_runner = MagicMock()
-        mock_beacon_runner_cls.return_value = mock_beacon_runner
-
-        main(led_count=120, rows=12, cols=10, duration=0.05)
-
-        mock_simulator_cls.assert_called_once_with(led_count=120, rows=12, cols=10)
-        mock_beacon_runner_cls.assert_called_once_with(120)
-
-    @patch("ble2wled.cli_simulator.LEDSimulator")
-    @patch("ble2wled.cli_simulator.BeaconRunner")
-    @patch("ble2wled.cli_simulator.MockBeaconGenerator")
-    @patch("ble2wled.cli_simulator.BeaconState")
-    @patch("ble2wled.cli_simulator.time.sleep")
-    @patch("ble2wled.cli_simulator.time.time")
-    def test_main_mock_mode(
-        self,
-        mock_time,
-        mock_sleep,  # pylint: disable=unused-argument
-        mock_beacon_state_cls,
-        mock_generator_cls,
-        mock_beacon_runner_cls,
-        mock_simulator_cls,
+    @pytest.mark.parametrize(
+        ("kwargs", "led_count", "rows", "cols"),
+        [
+            pytest.param({}, 60, 10, 6, id="defaults"),
+            pytest.param(
+                {"led_count": 120, "rows": 12, "cols": 10},
+                120,
+                12,
+                10,
+                id="custom-leds",
+            ),
+        ],
+    )
+    def test_main_creates_components(  # pylint: disable=too-many-arguments
+        self, cli_mocks, kwargs, led_count, rows, cols
     ):
+        """Test main builds the simulator, state and runner for the strip."""
+        main(duration=0.05, **kwargs)
+
+        cli_mocks.simulator_cls.assert_called_once_with(
+            led_count=led_count, rows=rows, cols=cols
+        )
+        cli_mocks.beacon_state_cls.assert_called_once()
+        cli_mocks.beacon_runner_cls.assert_called_once_with(led_count)
+
+    def test_main_mock_mode(self, cli_mocks):
         """Test main with mock beacon generator."""
-        # Use itertools.cycle to provide infinite time values
-        import itertools  # pylint: disable=import-outside-toplevel
-
-        mock_time.side_effect = itertools.cycle(
-            [0, 0, 0.06, 0.12]
-        )  # Will loop these values
-
-        mock_beacon_state = MagicMock()
-        mock_beacon_state.snapshot.return_value = {"beacon_001": (-50, 1.0)}
-        mock_beacon_state_cls.return_value = mock_beacon_state
-        mock_simulator = MagicMock()
-        mock_simulator_cls.return_value = mock_simulator
-        mock_beacon_runner = MagicMock()
-        mock_beacon_runner.next_position.return_value = 0
-        mock_beacon_runner_cls.return_value = mock_beacon_runner
-
-        mock_generator = MagicMock()
-        mock_generator.update.return_value = {"beacon_001": -50}
-        mock_generator_cls.return_value = mock_generator
+        cli_mocks.beacon_state.snapshot.return_value = {"beacon_001": (-50, 1.0)}
+        cli_mocks.generator.update.return_value = {"beacon_001": -50}
 
         main(use_mqtt=False, num_beacons=5, duration=0.05)
 
         # Verify generator was created
-        mock_generator_cls.assert_called_once_with(num_beacons=5)
+        cli_mocks.generator_cls.assert_called_once_with(num_beacons=5)
         # Verify generator.update was called
-        assert mock_generator.update.called
-
-    @patch("ble2wled.cli_simulator.LEDSimulator")
-    @patch("ble2wled.cli_simulator.BeaconRunner")
-    @patch("ble2wled.cli_simulator.EspresenseBeaconListener")
-    @patch("ble2wled.cli_simulator.time.sleep")
-    @patch("ble2wled.cli_simulator.time.time")
-    def test_main_mqtt_mode(
-        self,
-        mock_time,
-        mock_sleep,  # pylint: disable=unused-argument
-        mock_mqtt_listener_cls,
-        mock_beacon_runner_cls,
-        mock_simulator_cls,
-    ):
-        """Test main with MQTT mode."""
-        import itertools  # pylint: disable=import-outside-toplevel
-
-        mock_time.side_effect = itertools.cycle(
-            [0, 0, 0.06, 0.12]
-        )  # Will loop these values
-
-        mock_simulator = MagicMock()
-        mock_simulator_cls.return_value = mock_simulator
-        mock_beacon_runner = MagicMock()
-        mock_beacon_runner.next_position.return_value = 0
-        mock_beacon_runner_cls.return_value = mock_beacon_runner
-
-        mock_beacon_state = MagicMock()
-        mock_beacon_state.snapshot.return_value = {}
-
-        mock_mqtt_listener = MagicMock()
-        mock_mqtt_listener_cls.return_value = mock_mqtt_listener
-
-        with patch(
-            "ble2wled.cli_simulator.StatisticsTrackingBeaconState"
-        ) as mock_stats_state:
-            mock_stats_state.return_value = mock_beacon_state
-            main(
-                use_mqtt=True,
-                mqtt_broker="192.168.1.100",
-                mqtt_port=1883,
-                mqtt_location="bedroom",
-                duration=0.05,
-            )
-
-            # Verify MQTT listener was created with correct params
-            call_kwargs = mock_mqtt_listener_cls.call_args[1]
-            assert call_kwargs["broker"] == "192.168.1.100"
-            assert call_kwargs["port"] == 1883
-            assert call_kwargs["location"] == "bedroom"
-
-    @patch("ble2wled.cli_simulator.LEDSimulator")
-    @patch("ble2wled.cli_simulator.BeaconRunner")
-    @patch("ble2wled.cli_simulator.EspresenseBeaconListener")
-    @patch("ble2wled.cli_simulator.time.sleep")
-    @patch("ble2wled.cli_simulator.time.time")
-    def test_main_mqtt_with_auth(
-        self,
-        mock_time,
-        mock_sleep,  # pylint: disable=unused-argument
-        mock_mqtt_listener_cls,
-        mock_beacon_runner_cls,
-        mock_simulator_cls,
-    ):
-        """Test main with MQTT authentication."""
-        import itertools  # pylint: disable=import-outside-toplevel
-
-        mock_time.side_effect = itertools.cycle(
-            [0, 0, 0.06, 0.12]
-        )  # Will loop these values
-
-        mock_simulator = MagicMock()
-        mock_simulator_cls.return_value = mock_simulator
-        mock_beacon_runner = MagicMock()
-        mock_beacon_runner.next_position.return_value = 0
-        mock_beacon_runner_cls.return_value = mock_beacon_runner
-
-        mock_beacon_state = MagicMock()
-        mock_beacon_state.snapshot.return_value = {}
-
-        mock_mqtt_listener = MagicMock()
-        mock_mqtt_listener_cls.return_value = mock_mqtt_listener
-
-        with patch(
-            "ble2wled.cli_simulator.StatisticsTrackingBeaconState"
-        ) as mock_stats_state:
-            mock_stats_state.return_value = mock_beacon_state
-            main(
-                use_mqtt=True,
-                mqtt_broker="broker.example.com",
-                mqtt_port=8883,
-                mqtt_location="office",
-                mqtt_username="user",
-                mqtt_password="pass",
-                duration=0.05,
-            )
-
-            # Verify MQTT listener was created with auth params
-            call_kwargs = mock_mqtt_listener_cls.call_args[1]
-            assert call_kwargs["username"] == "user"
-            assert call_kwargs["password"] == "pass"
-
-    @patch("ble2wled.cli_simulator.LEDSimulator")
-    @patch("ble2wled.cli_simulator.BeaconRunner")
-    @patch("ble2wled.cli_simulator.BeaconState")
-    @patch("ble2wled.cli_simulator.time.sleep")
-    @patch("ble2wled.cli_simulator.time.time")
+        assert cli_mocks.generator.update.called
+
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            pytest.param(
+                {
+                    "mqtt_broker": "192.168.1.100",
+                    "mqtt_port": 1883,
+                    "mqtt_location": "bedroom",
+                },
+                {"broker": "192.168.1.100", "port": 1883, "location": "bedroom"},
+                id="mqtt-basic",
+            ),
+            pytest.param(
+                {
+                    "mqtt_broker": "broker.example.com",
+                    "mqtt_port": 8883,
+                    "mqtt_location": "office",
+                    "mqtt_username": "user",
+                    "mqtt_password": "pass",
+                },
+                {"username": "user", "password": "pass"},
+                id="mqtt-auth",
+            ),
+        ],
+    )
+    def test_main_mqtt_listener_args(self, cli_mocks, kwargs, expected):
+        """Test main passes the MQTT settings on to the listener."""
+        main(use_mqtt=True, duration=0.05, **kwargs)
+
+        call_kwargs = cli_mocks.mqtt_listener_cls.call_args[1]
+        assert {key: call_kwargs[key] for key in expected} == expected
+
+    def test_main_mqtt_stats_line_throttled(self, cli_mocks, capsys):
+        """Test that the statistics line is refreshed less often than frames."""
+        # Six frames at t=0 (plus the statistics clock reads), then stop
+        cli_mocks.monotonic.side_effect = [0] * 16 + [1, 1]
+
+        main(use_mqtt=True, update_interval=0.05, duration=0.5)
+
+        # 0.05s frames at 4 Hz refresh: frames 1 and 6 print the line
+        assert capsys.readouterr().out.count("\rMQTT:") == 2
+        # The statistics reuse the frame's snapshot instead of taking another
+        assert cli_mocks.beacon_state.snapshot.call_count == 6
+
+    def test_main_mqtt_stats_line_default_interval(self, cli_mocks, capsys):
+        """Test the default 0.1s interval stays under the statistics rate."""
+        # Seven frames at t=0 (plus the statistics clock reads), then stop
+        cli_mocks.monotonic.side_effect = [0] * 19 + [1, 1]
+
+        main(use_mqtt=True, update_interval=0.1, duration=0.5)
+
+        # 2.5 frames per refresh rounds up to 3: frames 1, 4 and 7 print
+        assert capsys.readouterr().out.count("\rMQTT:") == 3
+        assert cli_mocks.beacon_state.snapshot.call_count == 7
+
+    @pytest.mark.parametrize("use_mqtt", [False, True], ids=["mock", "mqtt"])
+    def test_main_zero_update_interval(self, cli_mocks, use_mqtt):
+        """Test main() runs with update_interval=0 instead of dividing by it."""
+        # A few frames at t=0 (plus any statistics clock reads), then stop
+        cli_mocks.monotonic.side_effect = [0] * 8 + [1] * 4
+
+        main(use_mqtt=use_mqtt, update_interval=0, duration=0.05)
+
+        cli_mocks.simulator.update.assert_called()
+
     def test_main_invalid_grid_dimensions(
         self,
-        mock_time,  # pylint: disable=unused-argument
-        mock_sleep,  # pylint: disable=unused-argument
-        mock_beacon_state_cls,  # pylint: disable=unused-argument
-        mock_beacon_runner_cls,  # pylint: disable=unused-argument
-        mock_simulator_cls,  # pylint: disable=unused-argument
+        cli_mocks,  # pylint: disable=unused-argument
     ):
         """Test main with mismatched LED count and grid dimensions."""
         with pytest.raises(ValueError) as exc_info:
@@ -430,269 +385,223 @@ class TestMainFunction:
 
         assert "does not equal led_count" in str(exc_info.value)
 
-    @patch("ble2wled.cli_simulator.LEDSimulator")
-    @patch("ble2wled.cli_simulator.BeaconRunner")
-    @patch("ble2wled.cli_simulator.BeaconState")
-    @patch("ble2wled.cli_simulator.time.sleep")
-    @patch("ble2wled.cli_simulator.time.time")
-    def test_main_update_interval(
-        self,
-        mock_time,
-        mock_sleep,
-        mock_beacon_state_cls,
-        mock_beacon_runner_cls,
-        mock_simulator_cls,
-    ):
+    def test_main_update_interval(self, cli_mocks):
         """Test that main uses specified update interval."""
-        import itertools  # pylint: disable=import-outside-toplevel
-
-        mock_time.side_effect = itertools.cycle(
-            [0, 0, 0.06, 0.12]
-        )  # Will loop these values
-
-        mock_beacon_state = MagicMock()
-        mock_beacon_state.snapshot.return_value = {}
-        mock_beacon_state_cls.return_value = mock_beacon_state
-        mock_simulator = MagicMock()
-        mock_simulator_cls.return_value = mock_simulator
-        mock_beacon_runner = MagicMock()
-        mock_beacon_runner_cls.return_value = mock_beacon_runner
+        # Start, frame check, end of frame (no render time), then stop
+        cli_mocks.monotonic.side_effect = itertools.cycle([0, 0, 0, 0.06])
 
         main(update_interval=0.05, duration=0.05)
 
         # Verify sleep was called with update_interval
-        assert mock_sleep.called
+        assert cli_mocks.sleep.called
         # Get the most recent call
-        last_call = mock_sleep.call_args_list[-1]
+        last_call = cli_mocks.sleep.call_args_list[-1]
         assert last_call[0][0] == 0.05
 
-    @patch("ble2wled.cli_simulator.LEDSimulator")
-    @patch("ble2wled.cli_simulator.BeaconRunner")
-    @patch("ble2wled.cli_simulator.BeaconState")
-    @patch("ble2wled.cli_simulator.ble_beacon_to_rgb")
-    @patch("ble2wled.cli_simulator.add_trail")
-    @patch("ble2wled.cli_simulator.time.sleep")
-    @patch("ble2wled.cli_simulator.time.time")
-    def test_main_renders_beacons(
-        self,
-        mock_time,
-        mock_sleep,  # pylint: disable=unused-argument
-        mock_add_trail,  # pylint: disable=unused-argument
-        mock_beacon_to_rgb,
-        mock_beacon_state_cls,
-        mock_beacon_runner_cls,
-        mock_simulator_cls,
-    ):
+    def test_main_sleep_compensates_render_time(self, cli_mocks):
+        """Test that frame render time is subtracted from the sleep."""
+        # Frame 1 renders in 0.02s, frame 2 overruns its slot, then stop
+        cli_mocks.monotonic.side_effect = [0, 0, 0.02, 0.05, 0.2, 0.3, 0.3]
+
+        main(update_interval=0.05, duration=0.25)
+
+        cli_mocks.sleep.assert_called_once()
+        assert cli_mocks.sleep.call_args[0][0] == pytest.approx(0.03)
+
+    def test_main_renders_beacons(self, cli_mocks, monkeypatch):
         """Test that main renders beacons to simulator."""
-        import itertools  # pylint: disable=import-outside-toplevel
+        monkeypatch.setattr(cs, "add_trail", MagicMock())
+        monkeypatch.setattr(
+            cs, "ble_beacon_to_rgb", MagicMock(return_value=[255, 0, 0])
+        )
+        cli_mocks.beacon_state.snapshot.return_value = {"beacon_001": (-50, 0.8)}
+        cli_mocks.beacon_runner.next_position.return_value = 5
 
-        mock_time.side_effect = itertools.cycle(
-            [0, 0, 0.06, 0.12]
-        )  # Will loop these values
+        main(led_count=60, duration=0.05)
 
-        mock_beacon_state = MagicMock()
-        mock_beacon_state.snapshot.return_value = {"beacon_001": (-50, 0.8)}
-        mock_beacon_state_cls.return_value = mock_beacon_state
+        # Verify simulator.update was called
+        assert cli_mocks.simulator.update.called
+
+    def test_main_clears_leds_between_frames(self, cli_mocks):
+        """Test that the reused LED buffer is blanked at the start of each frame."""
+        cli_mocks.monotonic.side_effect = [0, 0, 0, 0.06, 0.06, 0.12, 0.12]
+        cli_mocks.beacon_state.snapshot.side_effect = [
+            {"beacon_001": (-50, 1.0)},
+            {},
+        ]
+        cli_mocks.beacon_runner.next_position.return_value = 5
 
-        mock_simulator = MagicMock()
-        mock_simulator_cls.return_value = mock_simulator
+        frames = []
+        cli_mocks.simulator.update.side_effect = lambda leds: frames.append(
+            [list(led) for led in leds]
+        )
 
-        mock_beacon_runner = MagicMock()
-        mock_beacon_runner.next_position.return_value = 5
-        mock_beacon_runner_cls.return_value = mock_beacon_runner
+        main(led_count=60, duration=0.1)
 
-        mock_beacon_to_rgb.return_value = [255, 0, 0]
+        assert len(frames) == 2
+        assert frames[0][5] != [0, 0, 0]
+        assert all(led == [0, 0, 0] for led in frames[1])
 
-        main(led_count=60, duration=0.05)
+    def test_main_skips_idle_frames(self, cli_mocks):
+        """Test that the display is not redrawn while the strip stays blank."""
+        cli_mocks.monotonic.side_effect = [0, 0, 0, 0.06, 0.06, 0.12, 0.12, 0.2, 0.2]
 
-        # Verify simulator.update was called
-        assert mock_simulator.update.called
-
-    @patch("ble2wled.cli_simulator.LEDSimulator")
-    @patch("ble2wled.cli_simulator.BeaconRunner")
-    @patch("ble2wled.cli_simulator.BeaconState")
-    @patch("ble2wled.cli_simulator.time.sleep")
-    @patch("ble2wled.cli_simulator.time.time")
-    def test_main_respects_duration(
-        self,
-        mock_time,
-        mock_sleep,  # pylint: disable=unused-argument
-        mock_beacon_state_cls,
-        mock_beacon_runner_cls,
-        mock_simulator_cls,
-    ):
+        main(led_count=60, duration=0.15)
+
+        assert cli_mocks.beacon_state.snapshot.call_count == 3
+        cli_mocks.simulator.update.assert_called_once()
+
+    def test_main_respects_duration(self, cli_mocks):
         """Test that main stops after specified duration."""
         # Set times that will exceed duration
-        mock_time.side_effect = [0, 5.0, 10.0]  # Start at 0, then 5, then 10
-        mock_beacon_state = MagicMock()
-        mock_beacon_state.snapshot.return_value = {}
-        mock_beacon_state_cls.return_value = mock_beacon_state
-        mock_simulator = MagicMock()
-        mock_simulator_cls.return_value = mock_simulator
-        mock_beacon_runner = MagicMock()
-        mock_beacon_runner_cls.return_value = mock_beacon_runner
+        cli_mocks.monotonic.side_effect = [0, 5.0, 10.0]  # Start at 0, then 5, 10
 
         main(duration=2.0)  # Should exit when time > 2.0
 
         # Should not raise error
-        assert mock_simulator_cls.called
+        assert cli_mocks.simulator_cls.called
 
 
 class TestCLIArgumentParsing:
     """Tests for CLI argument parsing."""
 
-    def test_cli_defaults(self):
+    def test_cli_defaults(self, monkeypatch):
         """Test CLI with default arguments."""
-        with patch.object(sys, "argv", ["cli_simulator"]):
-            from ble2wled.cli_simulator import cli as cli_func  # pylint: disable=import-outside-toplevel
-
-            with patch("ble2wled.cli_simulator.main") as mock_main:
-                cli_func()
+        _set_argv(monkeypatch, "cli_simulator")
+        mock_main = MagicMock()
+        monkeypatch.setattr(cs, "main", mock_main)
+        cli()
+
+        # Verify main was called with defaults
+        call_kwargs = mock_main.call_args[1]
+        assert call_kwargs["led_count"] == 60
+        assert call_kwargs["rows"] == 10
+        assert call_kwargs["cols"] == 6
+        assert call_kwargs["num_beacons"] == 3
+        assert call_kwargs["update_interval"] == 0.1
+
+    def test_cli_custom_led_count(self, monkeypatch):
+        """Test CLI with custom LED count."""
+        _set_argv(
+            monkeypatch,
+            "cli_simulator",
+            "--led-count",
+            "120",
+            "--rows",
+            "12",
+            "--cols",
+            "10",
+        )
+        mock_main = MagicMock()
+        monkeypatch.setattr(cs, "main", mock_main)
+        cli()
 
-                # Verify main was called with defaults
-                call_kwargs = mock_main.call_args[1]
-                assert call_kwargs["led_count"] == 60
-                assert call_kwargs["rows"] == 10
-                assert call_kwargs["cols"] == 6
-                assert call_kwargs["num_beacons"] == 3
-                assert call_kwargs["update_interval"] == 0.1
+        call_kwargs = mock_main.call_args[1]
+        assert call_kwargs["led_count"] == 120
+        assert call_kwargs["rows"] == 12
+        assert call_kwargs["cols"] == 10
 
-    def test_cli_custom_led_count(self):
-        """Test CLI with custom LED count."""
-        with patch.object(
-            sys,
-            "argv",
-            ["cli_simulator", "--led-count", "120", "--rows", "12", "--cols", "10"],
-        ):
-            from ble2wled.cli_simulator import cli as cli_func  # pylint: disable=import-outside-toplevel
-
-            with patch("ble2wled.cli_simulator.main") as mock_main:
-                cli_func()
-
-                call_kwargs = mock_main.call_args[1]
-                assert call_kwargs["led_count"] == 120
-                assert call_kwargs["rows"] == 12
-                assert call_kwargs["cols"] == 10
-
-    def test_cli_custom_beacons(self):
+    def test_cli_custom_beacons(self, monkeypatch):
         """Test CLI with custom beacon count."""
-        with patch.object(sys, "argv", ["cli_simulator", "--beacons", "10"]):
-            from ble2wled.cli_simulator import cli as cli_func  # pylint: disable=import-outside-toplevel
-
-            with patch("ble2wled.cli_simulator.main") as mock_main:
-                cli_func()
+        _set_argv(monkeypatch, "cli_simulator", "--beacons", "10")
+        mock_main = MagicMock()
+        monkeypatch.setattr(cs, "main", mock_main)
+        cli()
 
-                call_kwargs = mock_main.call_args[1]
-                assert call_kwargs["num_beacons"] == 10
+        call_kwargs = mock_main.call_args[1]
+        assert call_kwargs["num_beacons"] == 10
 
-    def test_cli_mqtt_mode(self):
+    def test_cli_mqtt_mode(self, monkeypatch):
         """Test CLI with MQTT mode enabled."""
-        with patch.object(
-            sys, "argv", ["cli_simulator", "--mqtt", "--mqtt-broker", "192.168.1.100"]
-        ):
-            from ble2wled.cli_simulator import cli as cli_func  # pylint: disable=import-outside-toplevel
-
-            with patch("ble2wled.cli_simulator.main") as mock_main:
-                cli_func()
+        _set_argv(
+            monkeypatch, "cli_simulator", "--mqtt", "--mqtt-broker", "192.168.1.100"
+        )
+        mock_main = MagicMock()
+        monkeypatch.setattr(cs, "main", mock_main)
+        cli()
 
-                call_kwargs = mock_main.call_args[1]
-                assert call_kwargs["use_mqtt"] is True
-                assert call_kwargs["mqtt_broker"] == "192.168.1.100"
+        call_kwargs = mock_main.call_args[1]
+        assert call_kwargs["use_mqtt"] is True
+        assert call_kwargs["mqtt_broker"] == "192.168.1.100"
 
-    def test_cli_mqtt_with_auth(self):
+    def test_cli_mqtt_with_auth(self, monkeypatch):
         """Test CLI with MQTT authentication."""
-        with patch.object(
-            sys,
-            "argv",
-            [
-                "cli_simulator",
-                "--mqtt",
-                "--mqtt-broker",
-                "broker.example.com",
-                "--mqtt-username",
-                "testuser",
-                "--mqtt-password",
-                "testpass",
-            ],
-        ):
-            from ble2wled.cli_simulator import cli as cli_func  # pylint: disable=import-outside-toplevel
-
-            with patch("ble2wled.cli_simulator.main") as mock_main:
-                cli_func()
-
-                call_kwargs = mock_main.call_args[1]
-                assert call_kwargs["mqtt_username"] == "testuser"
-                assert call_kwargs["mqtt_password"] == "testpass"
-
-    def test_cli_invalid_led_count(self):
-        """Test CLI rejects non-positive LED count."""
-        with patch.object(sys, "argv", ["cli_simulator", "--led-count", "0"]):
-            from ble2wled.cli_simulator import cli as cli_func  # pylint: disable=import-outside-toplevel
+        _set_argv(
+            monkeypatch,
+            "cli_simulator",
+            "--mqtt",
+            "--mqtt-broker",
+            "broker.example.com",
+            "--mqtt-username",
+            "testuser",
+            "--mqtt-password",
+            "testpass",
+        )
+        mock_main = MagicMock()
+        monkeypatch.setattr(cs, "main", mock_main)
+        cli()
 
-            with pytest.raises(SystemExit):
-                cli_func()
+        call_kwargs = mock_main.call_args[1]
+        assert call_kwargs["mqtt_username"] == "testuser"
+        assert call_kwargs["mqtt_password"] == "testpass"
+
+    def test_cli_invalid_led_count(self, monkeypatch):
+        """Test CLI rejects non-positive LED count."""
+        _set_argv(monkeypatch, "cli_simulator", "--led-count", "0")
+        with pytest.raises(SystemExit):
+            cli()
 
-    def test_cli_invalid_grid_dimensions(self):
+    def test_cli_invalid_grid_dimensions(self, monkeypatch):
         """Test CLI rejects mismatched grid dimensions."""
-        with patch.object(
-            sys,
-            "argv",
-            [
-                "cli_simulator",
-                "--led-count",
-                "60",
-                "--rows",
-                "10",
-                "--cols",
-                "7",  # 10*7 = 70, not 60
-            ],
-        ):
-            from ble2wled.cli_simulator import cli as cli_func  # pylint: disable=import-outside-toplevel
-
-            with pytest.raises(SystemExit):
-                cli_func()
-
-    def test_cli_invalid_fade_factor(self):
-        """Test CLI rejects invalid fade factor."""
-        with patch.object(sys, "argv", ["cli_simulator", "--fade-factor", "1.5"]):
-            from ble2wled.cli_simulator import cli as cli_func  # pylint: disable=import-outside-toplevel
+        _set_argv(
+            monkeypatch,
+            "cli_simulator",
+            "--led-count",
+            "60",
+            "--rows",
+            "10",
+            "--cols",
+            "7",  # 10*7 = 70, not 60
+        )
+        with pytest.raises(SystemExit):
+            cli()
 
-            with pytest.raises(SystemExit):
-                cli_func()
+    def test_cli_invalid_fade_factor(self, monkeypatch):
+        """Test CLI rejects invalid fade factor."""
+        _set_argv(monkeypatch, "cli_simulator", "--fade-factor", "1.5")
+        with pytest.raises(SystemExit):
+            cli()
 
-    def test_cli_invalid_mqtt_port(self):
+    def test_cli_invalid_mqtt_port(self, monkeypatch):
         """Test CLI rejects invalid MQTT port."""
-        with patch.object(
-            sys, "argv", ["cli_simulator", "--mqtt", "--mqtt-port", "99999"]
-        ):
-            from ble2wled.cli_simulator import cli as cli_func  # pylint: disable=import-outside-toplevel
-
-            with pytest.raises(SystemExit):
-                cli_func()
+        _set_argv(monkeypatch, "cli_simulator", "--mqtt", "--mqtt-port", "99999")
+        with pytest.raises(SystemExit):
+            cli()
 
-    def test_cli_duration_argument(self):
+    def test_cli_duration_argument(self, monkeypatch):
         """Test CLI with custom duration."""
-        with patch.object(sys, "argv", ["cli_simulator", "--duration", "30.5"]):
-            from ble2wled.cli_simulator import cli as cli_func  # pylint: disable=import-outside-toplevel
+        _set_argv(monkeypatch, "cli_simulator", "--duration", "30.5")
+        mock_main = MagicMock()
+        monkeypatch.setattr(cs, "main", mock_main)
+        cli()
 
-            with patch("ble2wled.cli_simulator.main") as mock_main:
-                cli_func()
+        call_kwargs = mock_main.call_args[1]
+        assert call_kwargs["duration"] == 30.5
 
-                call_kwargs = mock_main.call_args[1]
-                assert call_kwargs["duration"] == 30.5
-
-    def test_cli_trail_settings(self):
+    def test_cli_trail_settings(self, monkeypatch):
         """Test CLI with custom trail settings."""
-        with patch.object(
-            sys,
-            "argv",
-            ["cli_simulator", "--trail-length", "15", "--fade-factor", "0.5"],
-        ):
-            from ble2wled.cli_simulator import cli as cli_func  # pylint: disable=import-outside-toplevel
-
-            with patch("ble2wled.cli_simulator.main") as mock_main:
-                cli_func()
-
-                call_kwargs = mock_main.call_args[1]
-                assert call_kwargs["trail_length"] == 15
-                assert call_kwargs["fade_factor"] == 0.5
+        _set_argv(
+            monkeypatch,
+            "cli_simulator",
+            "--trail-length",
+            "15",
+            "--fade-factor",
+            "0.5",
+        )
+        mock_main = MagicMock()
+        monkeypatch.setattr(cs, "main", mock_main)
+        cli()
+
+        call_kwargs = mock_main.call_args[1]
+        assert call_kwargs["trail_length"] == 15
+        assert call_kwargs["fade_factor"] == 0.5
@@ -1,14 +1,24 @@
 """Tests for CLI simulator MQTT functionality."""
-# pylint: disable=import-outside-toplevel
 
 import inspect
-from unittest.mock import MagicMock, patch
+import sys
+from unittest.mock import MagicMock
 
 import pytest
 
-from ble2wled.cli_simulator import main
+from ble2wled import cli_simulator as cs
+from ble2wled.cli_simulator import cli, main
+from ble2wled.simulator import MockBeaconGenerator
 from ble2wled.states import BeaconState
 
+# Signature objects are immutable, so one inspection serves every test
+_MAIN_SIG = inspect.signature(main)
+
+
+def _set_argv(monkeypatch, *args):
+    """Replace ``sys.argv`` with ``args`` for the duration of a test."""
+    monkeypatch.setattr(sys, "argv", list(args))
+
 
 class TestCLISimulatorMQTT:
     """Test cases for MQTT beacon mode in CLI simulator."""
@@ -17,7 +27,7 @@ class TestCLISimulatorMQTT:
         """Test that main accepts MQTT flag."""
         # This just tests that the function accepts the parameter
         # We can't actually run it without a broker, but we can verify the signature
-        sig = inspect.signature(main)
+        sig = _MAIN_SIG
         assert "use_mqtt" in sig.parameters
         assert "mqtt_broker" in sig.parameters
         assert "mqtt_port" in sig.parameters
@@ -25,7 +35,7 @@ class TestCLISimulatorMQTT:
 
     def test_mqtt_parameters_defaults(self):
         """Test MQTT parameter defaults."""
-        sig = inspect.signature(main)
+        sig = _MAIN_SIG
 
         assert sig.parameters["use_mqtt"].default is False
         assert sig.parameters["mqtt_broker"].default == "localhost"
@@ -44,11 +54,10 @@ class TestCLISimulatorMQTT:
         assert "test_beacon" in snapshot
         assert snapshot["test_beacon"][0] == -50  # RSSI
 
-    @patch("ble2wled.cli_simulator.EspresenseBeaconListener")
-    def test_mqtt_listener_created_with_correct_params(self, mock_listener_class):
+    def test_mqtt_listener_created_with_correct_params(self, monkeypatch):
         """Test that MQTT listener is created with correct parameters."""
-        mock_listener = MagicMock()
-        mock_listener_class.return_value = mock_listener
+        mock_listener_class = MagicMock()
+        monkeypatch.setattr(cs, "EspresenseBeaconListener", mock_listener_class)
 
         beacon_state = BeaconState()
 
@@ -73,8 +82,6 @@ class TestCLISimulatorMQTT:
 
     def test_mock_generator_still_works_without_mqtt(self):
         """Test that mock generator still works when not using MQTT."""
-        from ble2wled.simulator import MockBeaconGenerator
-
         generator = MockBeaconGenerator(num_beacons=2)
         beacons = generator.update(time_delta=0.1)
 
@@ -100,7 +107,7 @@ class TestCLISimulatorMQTT:
 
     def test_mqtt_mode_ignores_num_beacons_parameter(self):
         """Test that num_beacons parameter is ignored when using MQTT."""
-        sig = inspect.signature(main)
+        sig = _MAIN_SIG
 
         # Both parameters should exist
         assert "use_mqtt" in sig.parameters
@@ -109,21 +116,17 @@ class TestCLISimulatorMQTT:
         # When use_mqtt is True, num_beacons should not affect MQTT data source
         # (This is verified by the implementation logic)
 
-    def test_cli_validation_mqtt_port_range(self):
+    def test_cli_validation_mqtt_port_range(self, monkeypatch):
         """Test that CLI validates MQTT port range."""
-        import sys
-
-        from ble2wled.cli_simulator import cli
-
         # Test invalid port (too high)
-        with patch.object(sys, "argv", ["prog", "--mqtt-port", "99999"]):
-            with pytest.raises(SystemExit):
-                cli()
+        _set_argv(monkeypatch, "prog", "--mqtt-port", "99999")
+        with pytest.raises(SystemExit):
+            cli()
 
         # Test invalid port (too low)
-        with patch.object(sys, "argv", ["prog", "--mqtt-port", "0"]):
-            with pytest.raises(SystemExit):
-                cli()
+        _set_argv(monkeypatch, "prog", "--mqtt-port", "0")
+        with pytest.raises(SystemExit):
+            cli()
 
     def test_mqtt_beacon_timeout_configuration(self):
         """Test that beacon timeout is configured for MQTT mode."""
@@ -137,17 +140,13 @@ class TestCLISimulatorMQTT:
         snapshot1 = beacon_state.snapshot()
         assert "test" in snapshot1
 
-    def test_cli_help_includes_mqtt_options(self):
+    def test_cli_help_includes_mqtt_options(self, monkeypatch):
         """Test that CLI help includes MQTT options."""
-        import sys
-
-        from ble2wled.cli_simulator import cli
-
-        with patch.object(sys, "argv", ["prog", "--help"]):
-            with pytest.raises(SystemExit) as exc_info:
-                cli()
-            # Help should exit with code 0
-            assert exc_info.value.code == 0
+        _set_argv(monkeypatch, "prog", "--help")
+        with pytest.raises(SystemExit) as exc_info:
+            cli()
+        # Help should exit with code 0
+        assert exc_info.value.code == 0
 
     def test_main_docstring_includes_mqtt_example(self):
         """Test that main function docstring includes MQTT example."""
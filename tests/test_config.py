@@ -362,6 +362,18 @@ class TestConfigToDict:
 
             assert isinstance(config_dict, dict)
 
+    def test_to_dict_returns_independent_copies(self, clean_env):
+        """Test that modifying one to_dict result does not affect the next."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            env_file = Path(tmpdir) / ".env"
+            env_file.touch()
+            config = Config(str(env_file))
+
+            first = config.to_dict()
+            first["led_count"] = 1
+
+            assert config.to_dict()["led_count"] == 60
+
 
 class TestConfigComplexScenarios:
     """Test complex configuration scenarios."""
@@ -410,6 +422,18 @@ LOG_LEVEL=DEBUG
             assert config.mqtt_broker == "localhost"  # default
             assert config.trail_length == 10  # default
 
+    def test_values_cached_after_first_access(self, clean_env):
+        """Test that values are read once per Config instance."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            env_file = Path(tmpdir) / ".env"
+            env_file.write_text("LED_COUNT=100\n")
+            config = Config(str(env_file))
+            assert config.led_count == 100
+
+            os.environ["LED_COUNT"] = "120"
+            assert config.led_count == 100
+            assert Config(str(env_file)).led_count == 120
+
     def test_missing_env_file(self, clean_env):
         """Test loading config with missing env file uses defaults."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -419,3 +443,74 @@ LOG_LEVEL=DEBUG
             assert config.wled_host == "wled.local"
             assert config.led_count == 60
             assert config.mqtt_broker == "localhost"
+
+
+class TestEnvFileParsing:
+    """Test .env file parsing."""
+
+    def test_comments_and_blank_lines_ignored(self, clean_env):
+        """Test that comments and blank lines are skipped."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            env_file = Path(tmpdir) / ".env"
+            env_file.write_text("# WLED\n\nWLED_HOST=wled.home\n# LED_COUNT=5\n")
+            config = Config(str(env_file))
+
+            assert config.wled_host == "wled.home"
+            assert config.led_count == 60
+
+    def test_quoted_values(self, clean_env):
+        """Test that matching quotes around values are removed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            env_file = Path(tmpdir) / ".env"
+            env_file.write_text(
+                "WLED_HOST=\"wled # living room\"\nMQTT_BROKER='broker.local'\n"
+            )
+            config = Config(str(env_file))
+
+            assert config.wled_host == "wled # living room"
+            assert config.mqtt_broker == "broker.local"
+
+    @pytest.mark.parametrize(
+        ("line", "expected"),
+        [
+            pytest.param('WLED_HOST="wled.home"', "wled.home", id="double"),
+            pytest.param("WLED_HOST='wled.home'", "wled.home", id="single"),
+            pytest.param(
+                'WLED_HOST="wled.home" # note', "wled.home", id="double-comment"
+            ),
+            pytest.param(
+                "WLED_HOST='wled.home'  # note", "wled.home", id="single-comment"
+            ),
+            pytest.param(
+                'WLED_HOST="wled # home" # note', "wled # home", id="hash-in-quotes"
+            ),
+            pytest.param("WLED_HOST=wled.home # note", "wled.home", id="unquoted"),
+        ],
+    )
+    def test_quoted_values_with_trailing_comment(self, clean_env, line, expected):
+        """Test quotes are removed whether or not a comment follows them."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            env_file = Path(tmpdir) / ".env"
+            env_file.write_text(line + "\n")
+            config = Config(str(env_file))
+
+            assert config.wled_host == expected
+
+    def test_export_prefix_and_inline_comment(self, clean_env):
+        """Test export prefix and trailing comments on unquoted values."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            env_file = Path(tmpdir) / ".env"
+            env_file.write_text("export LED_COUNT = 120  # strip length\n")
+            config = Config(str(env_file))
+
+            assert config.led_count == 120
+
+    def test_existing_environment_not_overridden(self, clean_env):
+        """Test that process environment takes precedence over the file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            env_file = Path(tmpdir) / ".env"
+            env_file.write_text("WLED_HOST=from.file\n")
+            os.environ["WLED_HOST"] = "from.env"
+            config = Config(str(env_file))
+
+            assert config.wled_host == "from.env"
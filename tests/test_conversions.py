@@ -76,3 +76,16 @@ class TestBeaconToRGB:
 
         # Different beacons should have different colors (not all equal)
         assert (r1, g1, b1) != (r2, g2, b2)
+
+    def test_same_beacon_same_color(self):
+        """Test that repeated calls for a beacon return the same color."""
+        first = ble_beacon_to_rgb("beacon_1", -62, 0.8)
+        for _ in range(3):
+            assert ble_beacon_to_rgb("beacon_1", -62, 0.8) == first
+
+    def test_known_colors(self):
+        """Test exact colors for fixed inputs to guard against regressions."""
+        assert ble_beacon_to_rgb("beacon_1", -50, 1.0) == (0, 255, 113)
+        assert ble_beacon_to_rgb("beacon_2", -70, 0.5) == (59, 127, 0)
+        assert ble_beacon_to_rgb("aa:bb:cc", -90, 0.25) == (63, 19, 0)
+        assert ble_beacon_to_rgb("beacon_1", -62, 0.8) == (0, 204, 51)
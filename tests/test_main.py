@@ -12,6 +12,7 @@ Tests for run_wled_beacons function and main block execution covering:
 from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
+import requests
 
 from ble2wled.main import main, run_wled_beacons
 from ble2wled.states import BeaconState
@@ -86,9 +87,14 @@ class TestRunWledBeacons:
         state = Mock(spec=BeaconState)
         state.snapshot.return_value = {}
 
-        with patch("ble2wled.main.time.sleep") as mock_sleep:
+        with (
+            patch("ble2wled.main.time.sleep") as mock_sleep,
+            patch("ble2wled.main.time.monotonic") as mock_monotonic,
+        ):
             with patch("ble2wled.main.BeaconRunner"):
                 mock_sleep.side_effect = [None, KeyboardInterrupt()]
+                # Start, end of frame 1, end of frame 2 (one interval later)
+                mock_monotonic.side_effect = [0.0, 0.0, 0.25]
 
                 try:
                     run_wled_beacons(controller, 10, state, update_interval=0.25)
@@ -98,6 +104,31 @@ class TestRunWledBeacons:
                 # Should be called at least once with 0.25
                 assert any(call(0.25) == c for c in mock_sleep.call_args_list)
 
+    def test_run_wled_beacons_sleep_compensates_frame_time(self):
+        """Test that render time is subtracted and overruns skip the sleep."""
+        controller = Mock()
+        state = Mock(spec=BeaconState)
+        state.snapshot.return_value = {}
+
+        with (
+            patch("ble2wled.main.time.sleep") as mock_sleep,
+            patch("ble2wled.main.time.monotonic") as mock_monotonic,
+        ):
+            with patch("ble2wled.main.BeaconRunner"):
+                mock_sleep.side_effect = [None, KeyboardInterrupt()]
+                # Frame 1 takes 0.1s, frame 2 overruns, frame 3 takes 0.1s
+                mock_monotonic.side_effect = [0.0, 0.1, 1.0, 1.1]
+
+                try:
+                    run_wled_beacons(controller, 10, state, update_interval=0.25)
+                except KeyboardInterrupt:
+                    pass
+
+                assert mock_sleep.call_count == 2
+                first, second = (c[0][0] for c in mock_sleep.call_args_list)
+                assert first == pytest.approx(0.15)
+                assert second == pytest.approx(0.15)
+
     def test_run_wled_beacons_with_no_beacons(self):
         """Test animation loop with empty beacon state."""
         controller = Mock()
@@ -288,9 +319,13 @@ class TestRunWledBeacons:
         for interval in [0.05, 0.1, 0.2, 0.5, 1.0]:
             controller.reset_mock()
 
-            with patch("ble2wled.main.time.sleep") as mock_sleep:
+            with (
+                patch("ble2wled.main.time.sleep") as mock_sleep,
+                patch("ble2wled.main.time.monotonic") as mock_monotonic,
+            ):
                 with patch("ble2wled.main.BeaconRunner"):
                     mock_sleep.side_effect = [None, KeyboardInterrupt()]
+                    mock_monotonic.side_effect = [0.0, 0.0, interval]
 
                     try:
                         run_wled_beacons(
@@ -394,6 +429,28 @@ class TestRunWledBeacons:
                             leds = call_obj[0][0]
                             assert len(leds) == 5
 
+    def test_run_wled_beacons_frames_do_not_accumulate(self):
+        """Test that the reused LED buffer is blanked between frames."""
+        controller = Mock()
+        frames = []
+        controller.update.side_effect = lambda leds: frames.append(
+            [list(led) for led in leds]
+        )
+        state = Mock(spec=BeaconState)
+        state.snapshot.side_effect = [{"beacon_1": (-50, 1.0)}, {}]
+
+        with patch("ble2wled.main.time.sleep") as mock_sleep:
+            mock_sleep.side_effect = [None, KeyboardInterrupt()]
+
+            try:
+                run_wled_beacons(controller, 10, state)
+            except KeyboardInterrupt:
+                pass
+
+        assert len(frames) == 2
+        assert frames[0][0] != [0, 0, 0]
+        assert all(led == [0, 0, 0] for led in frames[1])
+
     def test_run_wled_beacons_beacon_runner_position_tracking(self):
         """Test that BeaconRunner tracks positions across iterations."""
         controller = Mock()
@@ -555,7 +612,89 @@ class TestMainFunction:
 
         main()
 
-        mock_http_controller_cls.assert_called_once_with("wled.local", 30)
+        mock_http_controller_cls.assert_called_once_with(
+            "wled.local", 30, retry_deadline=1.0
+        )
+
+    @patch("ble2wled.main.run_wled_beacons")
+    @patch("ble2wled.main.EspresenseBeaconListener")
+    @patch("ble2wled.main.BeaconState")
+    @patch("ble2wled.main.Config")
+    def test_main_http_retries_fit_update_interval(
+        self,
+        mock_config_cls,
+        mock_beacon_state_cls,
+        mock_listener_cls,
+        mock_run,
+    ):
+        """Test main() bounds HTTP retries so a failed frame fits the interval."""
+        config = MagicMock()
+        config.log_level = "INFO"
+        config.output_mode = "http"
+        config.wled_host = "wled.local"
+        config.led_count = 4
+        config.update_interval = 0.1
+        config.trail_length = 8
+        config.fade_factor = 0.7
+        config.beacon_timeout_seconds = 5.0
+        config.beacon_fade_out_seconds = 3.0
+        config.mqtt_broker = "localhost"
+        config.mqtt_location = "office"
+        config.mqtt_port = 1883
+        config.mqtt_username = None
+        config.mqtt_password = None
+        config.to_dict.return_value = {}
+        config.validate.return_value = None
+        mock_config_cls.return_value = config
+
+        sleeps = []
+
+        def run_one_failed_frame(controller, led_count, *args, **kwargs):
+            assert controller.retry_deadline == config.update_interval
+            with (
+                patch.object(
+                    controller.session,
+                    "post",
+                    side_effect=requests.exceptions.ConnectionError(),
+                ),
+                patch("ble2wled.wled.time.sleep", side_effect=sleeps.append),
+            ):
+                controller.update([[0, 0, 0]] * led_count)
+            raise KeyboardInterrupt
+
+        mock_run.side_effect = run_one_failed_frame
+
+        main()
+
+        mock_run.assert_called_once()
+        assert sleeps
+        assert sum(sleeps) < config.update_interval
+
+    @patch("ble2wled.main.WLEDUDPController")
+    @patch("ble2wled.main.EspresenseBeaconListener")
+    @patch("ble2wled.main.BeaconState")
+    @patch("ble2wled.main.Config")
+    def test_main_controller_error_leaves_mqtt_stopped(
+        self,
+        mock_config_cls,
+        mock_beacon_state_cls,  # pylint: disable=unused-argument
+        mock_listener_cls,
+        mock_udp_controller_cls,
+    ):
+        """Test an unresolvable WLED host fails before MQTT is started."""
+        config = MagicMock()
+        config.log_level = "INFO"
+        config.output_mode = "udp"
+        config.wled_host = "wled.local"
+        config.to_dict.return_value = {}
+        config.validate.return_value = None
+        mock_config_cls.return_value = config
+        mock_udp_controller_cls.side_effect = OSError("Name or service not known")
+
+        with pytest.raises(OSError, match="Name or service not known"):
+            main()
+
+        mock_listener_cls.return_value.start.assert_not_called()
 
     @patch("ble2wled.main.Config")
     def test_main_config_validation_error(self, mock_config_cls):
@@ -607,3 +746,4 @@ class TestMainFunction:
         main()
 
         mock_run.assert_called_once()
+        mock_listener_cls.return_value.stop.assert_called_once()
@@ -17,6 +17,19 @@ class TestEspresenseBeaconListener:
             assert listener.location == "balkon"
             assert listener.base_topic == "espresense/devices"
 
+    def test_on_connect_subscribes_to_location(self):
+        """Test that the subscription is narrowed to the configured location."""
+        state = BeaconState()
+        with patch("ble2wled.mqtt.mqtt.Client"):
+            listener = EspresenseBeaconListener(state, "localhost", location="balkon")
+
+            client = MagicMock()
+            listener.on_connect(client, None, {}, 0)
+
+            client.subscribe.assert_called_once_with(
+                "espresense/devices/+/balkon", qos=0
+            )
+
     def test_parse_topic_and_payload(self):
         """Test parsing topic and payload."""
         state = BeaconState()
@@ -146,3 +159,38 @@ class TestEspresenseBeaconListener:
             # Verify beacon was NOT updated
             snapshot = state.snapshot()
             assert len(snapshot) == 0
+
+    def test_handles_topic_without_prefix(self):
+        """Test that a topic missing the two-level prefix is ignored."""
+        state = BeaconState()
+        with patch("ble2wled.mqtt.mqtt.Client"):
+            listener = EspresenseBeaconListener(state, "localhost", location="balkon")
+
+            msg = MagicMock()
+            msg.topic = "devices/test/balkon"
+            msg.payload = b'{"id":"test","rssi":-50}'
+
+            listener.on_message(None, None, msg)  # type: ignore[arg-type]
+
+            assert len(state.snapshot()) == 0
+
+    def test_start_uses_client_loop(self):
+        """Test that start runs the paho network loop in the background."""
+        state = BeaconState()
+        with patch("ble2wled.mqtt.mqtt.Client") as mock_client_cls:
+            listener = EspresenseBeaconListener(state, "localhost")
+            listener.start()
+
+            mock_client_cls.return_value.loop_start.assert_called_once()
+
+    def test_stop_disconnects_and_stops_loop(self):
+        """Test that stop disconnects and stops the network loop."""
+        state = BeaconState()
+        with patch("ble2wled.mqtt.mqtt.Client") as mock_client_cls:
+            listener = EspresenseBeaconListener(state, "localhost")
+            listener.start()
+            listener.stop()
+
+            client = mock_client_cls.return_value
+            client.disconnect.assert_called_once()
+            client.loop_stop.assert_called_once()
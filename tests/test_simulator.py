@@ -5,6 +5,19 @@ import pytest
 from ble2wled.simulator import LEDSimulator, MockBeaconGenerator
 
 
+class FakeClock:
+    """Manually advanced clock for driving LEDSimulator repaint timing."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
 class TestLEDSimulator:
     """Test cases for LEDSimulator class."""
 
@@ -44,6 +57,144 @@ class TestLEDSimulator:
         snapshot = sim.get_snapshot()
         assert snapshot[0] == [255, 0, 0]
 
+    def test_update_publishes_new_frame(self):
+        """Test update replaces the frame instead of mutating the old one."""
+        sim = LEDSimulator(led_count=2, rows=1, cols=2)
+        sim.update([[255, 0, 0], [0, 255, 0]])
+        published = sim.current_leds
+
+        sim.update([[0, 0, 255], [0, 0, 0]])
+
+        assert published == [[255, 0, 0], [0, 255, 0]]
+        assert sim.current_leds is not published
+
+    def test_update_identical_frame_keeps_published_list(self):
+        """Test an unchanged frame is not copied again."""
+        sim = LEDSimulator(led_count=2, rows=1, cols=2)
+        leds = [[255, 0, 0], [0, 255, 0]]
+        sim.update(leds)
+        published = sim.current_leds
+
+        sim.update(leds)
+
+        assert sim.current_leds is published
+
+    def test_update_skips_identical_frame(self, capsys):
+        """Test that an unchanged frame is not redrawn."""
+        sim = LEDSimulator(led_count=2, rows=1, cols=2, clock=FakeClock())
+        leds = [[255, 0, 0], [0, 255, 0]]
+
+        sim.update(leds)
+        assert capsys.readouterr().out
+
+        sim.update([list(led) for led in leds])
+        assert capsys.readouterr().out == ""
+
+        leds[1] = [0, 0, 255]
+        sim.update(leds)
+        assert capsys.readouterr().out
+        assert sim.get_snapshot() == leds
+
+    def test_first_update_renders_blank_frame(self, capsys):
+        """Test that the initial all-off frame is still drawn once."""
+        sim = LEDSimulator(led_count=2, rows=1, cols=2)
+        sim.update([[0, 0, 0], [0, 0, 0]])
+        assert capsys.readouterr().out
+
+    def test_render_output(self, capsys):
+        """Test the rendered frame layout."""
+        sim = LEDSimulator(led_count=2, rows=1, cols=2)
+        sim.update([[255, 0, 0], [0, 0, 30]])
+
+        lines = capsys.readouterr().out.split("\n")
+        assert lines[0] == "\033[H\033[JLED Strip Simulator - Press Ctrl+C to exit"
+        assert lines[1] == "=" * 10
+        assert lines[2] == ("\033[38;2;255;0;0m█\033[0m  \033[38;2;0;0;30m█\033[0m  ")
+        assert lines[3] == "=" * 10
+        assert lines[4] == "Average brightness: 47.5/255"
+
+    def test_render_repaints_only_changed_cells(self, capsys):
+        """Test later frames only redraw changed cells and the footer."""
+        sim = LEDSimulator(led_count=4, rows=2, cols=2, clock=FakeClock())
+        sim.update([[0, 0, 0], [0, 0, 0], [0, 0, 0], [0, 0, 0]])
+        capsys.readouterr()
+
+        sim.update([[0, 0, 0], [0, 0, 0], [0, 0, 0], [30, 0, 0]])
+
+        out = capsys.readouterr().out
+        assert out == (
+            "\033[4;4H\033[38;2;30;0;0m█\033[0m  "
+            "\033[6;1H\033[KAverage brightness: 2.5/255\n"
+        )
+
+    def test_render_repaints_whole_grid_periodically(self, capsys):
+        """Test the whole grid is redrawn once full_repaint_interval passes."""
+        clock = FakeClock()
+        sim = LEDSimulator(
+            led_count=2, rows=1, cols=2, full_repaint_interval=1.0, clock=clock
+        )
+        sim.update([[0, 0, 0], [0, 0, 0]])
+        capsys.readouterr()
+
+        clock.advance(0.5)
+        sim.update([[30, 0, 0], [0, 0, 0]])
+        assert not capsys.readouterr().out.startswith("\033[H")
+
+        clock.advance(0.5)
+        sim.update([[0, 30, 0], [0, 0, 0]])
+        out = capsys.readouterr().out
+
+        # Redrawn in place: every line is cleared to its end, and only the
+        # rows below the status line after the footer are erased
+        lines = out.split("\n")
+        assert lines[0] == "\033[HLED Strip Simulator - Press Ctrl+C to exit\033[K"
+        assert lines[2] == (
+            "\033[38;2;0;30;0m█\033[0m  \033[38;2;0;0;0m█\033[0m  \033[K"
+        )
+        assert lines[4] == "Average brightness: 5.0/255\033[K"
+        assert lines[5] == "\033[7;1H\033[J\033[6;1H"
+
+    def test_update_repaints_identical_frame_when_due(self, capsys):
+        """Test an unchanged frame is still redrawn when a repaint is due."""
+        clock = FakeClock()
+        sim = LEDSimulator(led_count=2, rows=1, cols=2, clock=clock)
+        leds = [[255, 0, 0], [0, 255, 0]]
+        sim.update(leds)
+        capsys.readouterr()
+
+        published = sim.current_leds
+
+        clock.advance(1.0)
+        sim.update(leds)
+
+        assert capsys.readouterr().out.startswith("\033[HLED Strip Simulator")
+        assert sim.current_leds is published
+
+    def test_invalidate_forces_full_repaint(self, capsys):
+        """Test invalidate() makes the next frame redraw the whole grid."""
+        sim = LEDSimulator(led_count=2, rows=1, cols=2, clock=FakeClock())
+        leds = [[255, 0, 0], [0, 255, 0]]
+        sim.update(leds)
+        capsys.readouterr()
+
+        sim.invalidate()
+        sim.update([[255, 0, 0], [0, 0, 255]])
+
+        assert capsys.readouterr().out.startswith("\033[H\033[J")
+
+    def test_render_writes_while_holding_lock(self, monkeypatch):
+        """Test frames are diffed and written under the simulator lock."""
+        sim = LEDSimulator(led_count=2, rows=1, cols=2, clock=FakeClock())
+        held = []
+        monkeypatch.setattr(
+            "sys.stdout.write", lambda output: held.append(sim.lock.locked())
+        )
+
+        sim.update([[255, 0, 0], [0, 0, 0]])
+        sim.update([[0, 255, 0], [0, 0, 0]])
+
+        assert held == [True, True]
+
     def test_get_snapshot_returns_copy(self):
         """Test that get_snapshot returns copy, not reference."""
         sim = LEDSimulator(led_count=2, rows=1, cols=2)
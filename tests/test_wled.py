@@ -8,6 +8,9 @@ Tests cover HTTP and UDP controllers with various scenarios:
 - HTTP timeout and connection errors
 """
 
+import errno
+import json
+import logging
 import socket
 from unittest.mock import MagicMock, Mock, patch
 
@@ -66,8 +69,11 @@ class TestWLEDHTTPController:
         assert controller.host == "192.168.1.100"
         assert controller.led_count == 60
         assert controller.max_retries == 3
+        assert controller.retry_deadline is None
+        assert controller.retry_backoff == 0.02
         assert controller.timeout == 1
         assert controller.url == "http://192.168.1.100/json/state"
+        assert isinstance(controller.session, requests.Session)
 
     def test_init_custom_retries(self):
         """Test HTTP controller initialization with custom retry count."""
@@ -83,7 +89,7 @@ class TestWLEDHTTPController:
         controller = WLEDHTTPController(host="192.168.1.100", led_count=2)
         leds = [[255, 0, 0], [0, 255, 0]]
 
-        with patch("ble2wled.wled.requests.post") as mock_post:
+        with patch.object(controller.session, "post") as mock_post:
             controller.update(leds)
 
             mock_post.assert_called_once()
@@ -92,22 +98,45 @@ class TestWLEDHTTPController:
             assert call_args[1]["timeout"] == 1
 
             # Verify payload structure
-            payload = call_args[1]["json"]
+            payload = json.loads(call_args[1]["data"])
             assert payload["on"] is True
             assert payload["seg"][0]["id"] == 0
-            assert payload["seg"][0]["i"] == leds
+            assert payload["seg"][0]["i"] == ["ff0000", "00ff00"]
+
+    def test_update_reuses_session(self):
+        """Test consecutive updates share one persistent session."""
+        controller = WLEDHTTPController(host="192.168.1.100", led_count=1)
+        session = controller.session
+
+        with patch.object(session, "post") as mock_post:
+            controller.update([[255, 0, 0]])
+            controller.update([[0, 255, 0]])
+
+        assert controller.session is session
+        assert mock_post.call_count == 2
+
+    def test_update_sends_compact_json_body(self):
+        """Test payload is posted as a compact pre-encoded JSON body."""
+        controller = WLEDHTTPController(host="192.168.1.100", led_count=2)
+
+        with patch.object(controller.session, "post") as mock_post:
+            controller.update([[255, 0, 0], [0, 255, 0]])
+
+        body = mock_post.call_args[1]["data"]
+        assert body == '{"on":true,"seg":[{"id":0,"i":["ff0000","00ff00"]}]}'
+        assert controller.session.headers["Content-Type"] == "application/json"
 
     def test_update_with_single_led(self):
         """Test updating with single LED."""
         controller = WLEDHTTPController(host="test.host", led_count=1)
         leds = [[128, 64, 32]]
 
-        with patch("ble2wled.wled.requests.post") as mock_post:
+        with patch.object(controller.session, "post") as mock_post:
             controller.update(leds)
 
-            payload = mock_post.call_args[1]["json"]
+            payload = json.loads(mock_post.call_args[1]["data"])
             assert len(payload["seg"][0]["i"]) == 1
-            assert payload["seg"][0]["i"][0] == [128, 64, 32]
+            assert payload["seg"][0]["i"][0] == "804020"
 
     def test_update_with_many_leds(self):
         """Test updating with large LED strip."""
@@ -115,10 +144,10 @@ class TestWLEDHTTPController:
         controller = WLEDHTTPController(host="192.168.1.100", led_count=led_count)
         leds = [[i % 256, (i * 2) % 256, (i * 3) % 256] for i in range(led_count)]
 
-        with patch("ble2wled.wled.requests.post") as mock_post:
+        with patch.object(controller.session, "post") as mock_post:
             controller.update(leds)
 
-            payload = mock_post.call_args[1]["json"]
+            payload = json.loads(mock_post.call_args[1]["data"])
             assert len(payload["seg"][0]["i"]) == led_count
 
     def test_update_retries_on_timeout(self):
@@ -131,7 +160,7 @@ class TestWLEDHTTPController:
         success_response = Mock()
         success_response.raise_for_status.return_value = None
 
-        with patch("ble2wled.wled.requests.post") as mock_post:
+        with patch.object(controller.session, "post") as mock_post:
             # Fail twice, then succeed
             mock_post.side_effect = [
                 requests.exceptions.Timeout(),
@@ -151,7 +180,7 @@ class TestWLEDHTTPController:
         )
         leds = [[255, 0, 0]]
 
-        with patch("ble2wled.wled.requests.post") as mock_post:
+        with patch.object(controller.session, "post") as mock_post:
             mock_post.side_effect = requests.exceptions.ConnectionError()
 
             controller.update(leds)
@@ -169,7 +198,7 @@ class TestWLEDHTTPController:
         success_response = Mock()
         success_response.raise_for_status.return_value = None
 
-        with patch("ble2wled.wled.requests.post") as mock_post:
+        with patch.object(controller.session, "post") as mock_post:
             # Fail once, then succeed
             mock_post.side_effect = [
                 requests.exceptions.ReadTimeout(),
@@ -187,7 +216,7 @@ class TestWLEDHTTPController:
         )
         leds = [[50, 50, 50]]
 
-        with patch("ble2wled.wled.requests.post") as mock_post:
+        with patch.object(controller.session, "post") as mock_post:
             # Non-timeout/connection error - caught by generic RequestException handler
             mock_post.side_effect = requests.exceptions.InvalidURL()
 
@@ -202,7 +231,7 @@ class TestWLEDHTTPController:
         controller = WLEDHTTPController(host="192.168.1.100", led_count=1)
         leds = [[0, 0, 0]]
 
-        with patch("ble2wled.wled.requests.post"):
+        with patch.object(controller.session, "post"):
             result = controller.update(leds)  # pylint: disable=assignment-from-none
 
             assert result is None
@@ -217,7 +246,7 @@ class TestWLEDHTTPController:
         success_response = Mock()
         success_response.raise_for_status.return_value = None
 
-        with patch("ble2wled.wled.requests.post") as mock_post:
+        with patch.object(controller.session, "post") as mock_post:
             with patch("ble2wled.wled.time.sleep") as mock_sleep:
                 mock_post.side_effect = [
                     requests.exceptions.Timeout(),
@@ -227,7 +256,56 @@ class TestWLEDHTTPController:
                 controller.update(leds)
 
                 # Should have slept between attempts
-                mock_sleep.assert_called_once_with(0.05)
+                mock_sleep.assert_called_once_with(0.02)
+
+    def test_update_backs_off_exponentially(self):
+        """Test that the retry delay doubles after each failed attempt."""
+        controller = WLEDHTTPController(
+            host="192.168.1.100", led_count=1, max_retries=4
+        )
+
+        with patch.object(controller.session, "post") as mock_post:
+            with patch("ble2wled.wled.time.sleep") as mock_sleep:
+                mock_post.side_effect = requests.exceptions.Timeout()
+
+                controller.update([[0, 0, 0]])
+
+        assert mock_post.call_count == 4
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.02, 0.04, 0.08]
+
+    def test_update_stops_retrying_at_deadline(self):
+        """Test that no retry is attempted once the deadline would pass."""
+        controller = WLEDHTTPController(
+            host="192.168.1.100", led_count=1, max_retries=3, retry_deadline=0.1
+        )
+
+        with patch.object(controller.session, "post") as mock_post:
+            with patch("ble2wled.wled.time.sleep") as mock_sleep:
+                with patch(
+                    "ble2wled.wled.time.monotonic", side_effect=[0.0, 0.02, 0.06]
+                ):
+                    mock_post.side_effect = requests.exceptions.Timeout()
+
+                    controller.update([[0, 0, 0]])
+
+        # First retry (0.02 + 0.02 < 0.1) runs, second (0.06 + 0.04) is skipped
+        assert mock_post.call_count == 2
+        mock_sleep.assert_called_once_with(0.02)
+
+    def test_update_default_backoff_fits_one_frame(self):
+        """Test that a failed frame sleeps less than a 0.1 s frame period."""
+        controller = WLEDHTTPController(
+            host="192.168.1.100", led_count=1, retry_deadline=0.1
+        )
+
+        with patch.object(controller.session, "post") as mock_post:
+            with patch("ble2wled.wled.time.sleep") as mock_sleep:
+                mock_post.side_effect = requests.exceptions.ConnectionError()
+
+                controller.update([[0, 0, 0]])
+
+        assert mock_post.call_count == 3
+        assert sum(c.args[0] for c in mock_sleep.call_args_list) < 0.1
 
     def test_update_with_custom_timeout(self):
         """Test that timeout is used in requests."""
@@ -235,7 +313,7 @@ class TestWLEDHTTPController:
         controller.timeout = 2  # timeout is int, set to 2 seconds
         leds = [[0, 0, 0]]
 
-        with patch("ble2wled.wled.requests.post") as mock_post:
+        with patch.object(controller.session, "post") as mock_post:
             controller.update(leds)
 
             # Verify timeout was passed
@@ -246,22 +324,22 @@ class TestWLEDHTTPController:
         controller = WLEDHTTPController(host="test.host", led_count=3)
         leds = [[0, 0, 0], [0, 0, 0], [0, 0, 0]]
 
-        with patch("ble2wled.wled.requests.post") as mock_post:
+        with patch.object(controller.session, "post") as mock_post:
             controller.update(leds)
 
-            payload = mock_post.call_args[1]["json"]
-            assert all(rgb == [0, 0, 0] for rgb in payload["seg"][0]["i"])
+            payload = json.loads(mock_post.call_args[1]["data"])
+            assert payload["seg"][0]["i"] == ["000000"] * 3
 
     def test_update_all_max_brightness(self):
         """Test updating with all white (max brightness) LEDs."""
         controller = WLEDHTTPController(host="test.host", led_count=3)
         leds = [[255, 255, 255], [255, 255, 255], [255, 255, 255]]
 
-        with patch("ble2wled.wled.requests.post") as mock_post:
+        with patch.object(controller.session, "post") as mock_post:
             controller.update(leds)
 
-            payload = mock_post.call_args[1]["json"]
-            assert all(rgb == [255, 255, 255] for rgb in payload["seg"][0]["i"])
+            payload = json.loads(mock_post.call_args[1]["data"])
+            assert payload["seg"][0]["i"] == ["ffffff"] * 3
 
 
 class TestWLEDUDPController:
@@ -308,15 +386,15 @@ class TestWLEDUDPController:
 
             controller.update(leds)
 
-            # Verify sendto was called
-            mock_socket.sendto.assert_called_once()
+            # Verify send was called on the connected socket
+            mock_socket.connect.assert_called_once_with(("192.168.1.100", 21324))
+            mock_socket.send.assert_called_once()
 
             # Get the packet that was sent
-            packet, addr = mock_socket.sendto.call_args[0]
+            (packet,) = mock_socket.send.call_args[0]
 
             # Verify packet structure
             assert packet[:4] == b"DRGB"  # Header
-            assert addr == ("192.168.1.100", 21324)
             assert len(packet) == 4 + (3 * 2)  # Header + 2 LEDs
 
     def test_update_drgb_payload_single_led(self):
@@ -330,7 +408,7 @@ class TestWLEDUDPController:
 
             controller.update(leds)
 
-            packet, _ = mock_socket.sendto.call_args[0]
+            (packet,) = mock_socket.send.call_args[0]
 
             assert packet == b"DRGB\xc8\x64\x32"  # DRGB + RGB bytes
 
@@ -345,7 +423,7 @@ class TestWLEDUDPController:
 
             controller.update(leds)
 
-            packet, _ = mock_socket.sendto.call_args[0]
+            (packet,) = mock_socket.send.call_args[0]
 
             # Expected: DRGB + RGB triplets
             expected = (
@@ -365,11 +443,65 @@ class TestWLEDUDPController:
 
             controller.update(leds)
 
-            packet, _ = mock_socket.sendto.call_args[0]
+            (packet,) = mock_socket.send.call_args[0]
 
             # Header is 4 bytes, plus 3 bytes per LED
             assert len(packet) == 4 + (3 * led_count)
 
+    def test_update_logs_send_errors(self, caplog):
+        """Test that a failed send is logged instead of raised."""
+        with patch("ble2wled.wled.socket.socket") as mock_socket_class:
+            mock_socket = MagicMock()
+            mock_socket.send.side_effect = ConnectionRefusedError(
+                errno.ECONNREFUSED, "refused"
+            )
+            mock_socket_class.return_value = mock_socket
+
+            controller = WLEDUDPController(host="test.host", led_count=1)
+            controller.update([[0, 0, 0]])
+
+        assert "UDP send to test.host failed" in caplog.text
+
+    def test_update_logs_each_outage_once(self, caplog):
+        """Test that repeated send failures warn once until a send succeeds."""
+        with patch("ble2wled.wled.socket.socket") as mock_socket_class:
+            mock_socket = MagicMock()
+            refused = ConnectionRefusedError(errno.ECONNREFUSED, "refused")
+            mock_socket.send.side_effect = [refused, refused, refused, 5, refused]
+            mock_socket_class.return_value = mock_socket
+
+            controller = WLEDUDPController(host="test.host", led_count=1)
+            with caplog.at_level(logging.INFO, logger="ble2wled.wled"):
+                for _ in range(5):
+                    controller.update([[0, 0, 0]])
+
+        assert caplog.text.count("UDP send to test.host failed") == 2
+        assert caplog.text.count("UDP send to test.host recovered") == 1
+
+    @pytest.mark.parametrize(
+        "code", [errno.ECONNREFUSED, errno.EHOSTUNREACH, errno.ENETUNREACH]
+    )
+    def test_update_drops_frame_while_unreachable(self, code):
+        """Test that connectivity errors drop the frame instead of raising."""
+        with patch("ble2wled.wled.socket.socket") as mock_socket_class:
+            mock_socket = MagicMock()
+            mock_socket.send.side_effect = OSError(code, "unreachable")
+            mock_socket_class.return_value = mock_socket
+
+            controller = WLEDUDPController(host="test.host", led_count=1)
+            controller.update([[0, 0, 0]])
+
+    def test_update_raises_other_send_errors(self):
+        """Test that non-connectivity send errors are not swallowed."""
+        with patch("ble2wled.wled.socket.socket") as mock_socket_class:
+            mock_socket = MagicMock()
+            mock_socket.send.side_effect = OSError(errno.EMSGSIZE, "too long")
+            mock_socket_class.return_value = mock_socket
+
+            controller = WLEDUDPController(host="test.host", led_count=1)
+            with pytest.raises(OSError, match="too long"):
+                controller.update([[0, 0, 0]])
+
     def test_update_returns_none(self):
         """Test that update method returns None."""
         with patch("ble2wled.wled.socket.socket"):
@@ -391,7 +523,7 @@ class TestWLEDUDPController:
 
             controller.update(leds)
 
-            packet, _ = mock_socket.sendto.call_args[0]
+            (packet,) = mock_socket.send.call_args[0]
 
             assert packet == b"DRGB\x00\x00\x00\x00\x00\x00"
 
@@ -406,7 +538,7 @@ class TestWLEDUDPController:
 
             controller.update(leds)
 
-            packet, _ = mock_socket.sendto.call_args[0]
+            (packet,) = mock_socket.send.call_args[0]
 
             assert packet == b"DRGB\xff\xff\xff\xff\xff\xff"
 
@@ -421,9 +553,7 @@ class TestWLEDUDPController:
 
             controller.update(leds)
 
-            _, addr = mock_socket.sendto.call_args[0]
-
-            assert addr == ("test.host", 9999)
+            mock_socket.connect.assert_called_once_with(("test.host", 9999))
 
     def test_update_different_hosts(self):
         """Test update with different host addresses."""
@@ -435,14 +565,14 @@ class TestWLEDUDPController:
             controller1 = WLEDUDPController(host="192.168.1.100", led_count=1)
             leds = [[0, 0, 0]]
             controller1.update(leds)
-            addr1 = mock_socket.sendto.call_args[0][1]
+            addr1 = mock_socket.connect.call_args[0][0]
             assert addr1[0] == "192.168.1.100"
 
             # Test with hostname
             mock_socket.reset_mock()
             controller2 = WLEDUDPController(host="wled.local", led_count=1)
             controller2.update(leds)
-            addr2 = mock_socket.sendto.call_args[0][1]
+            addr2 = mock_socket.connect.call_args[0][0]
             assert addr2[0] == "wled.local"
 
 
@@ -455,10 +585,12 @@ class TestControllerIntegration:
 
         # HTTP controller
         http_controller = WLEDHTTPController(host="test.host", led_count=3)
-        with patch("ble2wled.wled.requests.post") as mock_post:
+        with patch.object(http_controller.session, "post") as mock_post:
             http_controller.update(leds)
-            http_payload = mock_post.call_args[1]["json"]
-            http_leds = http_payload["seg"][0]["i"]
+            http_payload = json.loads(mock_post.call_args[1]["data"])
+            http_leds = [
+                list(bytes.fromhex(color)) for color in http_payload["seg"][0]["i"]
+            ]
 
         # UDP controller
         with patch("ble2wled.wled.socket.socket") as mock_socket_class:
@@ -468,7 +600,7 @@ class TestControllerIntegration:
             udp_controller = WLEDUDPController(host="test.host", led_count=3)
             udp_controller.update(leds)
 
-            packet, _ = mock_socket.sendto.call_args[0]
+            (packet,) = mock_socket.send.call_args[0]
             udp_leds = [list(packet[i : i + 3]) for i in range(4, len(packet), 3)]
 
         # Both should have same LED data